@@ -10,10 +10,40 @@ Author / Yazar: ensfur
 License / Lisans: MIT
 """
 
+import atexit
+import copy
+import hashlib
 import json
+import logging
 import os
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson  # Optional faster JSON parser / İsteğe bağlı hızlı JSON ayrıştırıcı
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Default configuration template / Varsayılan konfigürasyon şablonu
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "connections": [],
+    "last_connection": None,
+    "settings": {
+        "default_remote_path": "/home/pi",
+        "auto_save_connections": True,
+        "show_hidden_files": False,
+        "transfer_timeout": 300,
+        "transfer_buffer_size": 256 * 1024,
+        "max_concurrent_requests": 64,
+        "max_parallel_transfers": 4,
+        "tcp_buffer_size": 4 * 1024 * 1024,
+        "parallel_connections": 1,
+        "remote_cache_ttl": 5.0
+    }
+}
+
 
 class ConfigManager:
     """Configuration management class / Konfigürasyon yönetim sınıfı"""
@@ -26,24 +56,47 @@ class ConfigManager:
             config_file: Path to configuration file / Konfigürasyon dosyası yolu
         """
         self.config_file = config_file
-        self.config = self._load_config()
+        loaded = self._load_config()
+        self.config: Dict[str, Any] = loaded if loaded is not None else self._create_default_config()
+        
+        # Cached sub-containers of the config / Konfigürasyonun önbelleğe alınmış alt kapsayıcıları
+        self._connections_list: List[Dict[str, Any]] = self.config.setdefault("connections", [])
+        self._settings: Dict[str, Any] = self.config.setdefault("settings", {})
+        
+        # Name to connection index / Ad-bağlantı dizini
+        self._conn_index: Dict[str, Dict[str, Any]] = {conn["name"]: conn for conn in self._connections_list}
+        
+        # Digest of the last content on disk; only a file that parsed is known to match it,
+        # a missing or corrupt one gets rewritten
+        # Diskteki son içeriğin özeti; yalnızca ayrıştırılan dosyanın onunla eşleştiği bilinir,
+        # eksik veya bozuk olan yeniden yazılır
+        self._last_saved_digest: Optional[bytes] = self._digest(self._serialize()) if loaded is not None else None
+        
+        # Write batching state / Yazma toplama durumu
+        self._dirty = False
+        self._autosave = True
+        atexit.register(self.flush)
     
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> Optional[Dict[str, Any]]:
         """
         Load configuration from file / Dosyadan konfigürasyonu yükle
         
         Returns:
-            Configuration dictionary / Konfigürasyon sözlüğü
+            Configuration dictionary, or None if the file is missing or unreadable
+            Konfigürasyon sözlüğü, dosya yoksa veya okunamıyorsa None
         """
         try:
             if os.path.exists(self.config_file):
+                if orjson is not None:
+                    with open(self.config_file, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             else:
-                return self._create_default_config()
+                return None
         except Exception as e:
-            print(f"Config loading error / Konfigürasyon yükleme hatası: {e}")
-            return self._create_default_config()
+            logger.error("Config loading error / Konfigürasyon yükleme hatası: %s", e)
+            return None
     
     def _create_default_config(self) -> Dict[str, Any]:
         """
@@ -52,16 +105,34 @@ class ConfigManager:
         Returns:
             Default configuration dictionary / Varsayılan konfigürasyon sözlüğü
         """
-        return {
-            "connections": [],
-            "last_connection": None,
-            "settings": {
-                "default_remote_path": "/home/pi",
-                "auto_save_connections": True,
-                "show_hidden_files": False,
-                "transfer_timeout": 300
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
+    
+    def _serialize(self) -> bytes:
+        """
+        Serialize configuration to JSON bytes / Konfigürasyonu JSON baytlarına çevir
+        
+        Always the standard library, so the file layout does not depend on
+        whether orjson is installed.
+        Dosya düzeni orjson'ın kurulu olup olmamasına bağlı olmasın diye
+        her zaman standart kütüphane kullanılır.
+        
+        Returns:
+            Encoded configuration / Kodlanmış konfigürasyon
+        """
+        return json.dumps(self.config, indent=4, ensure_ascii=False).encode('utf-8')
+    
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        """
+        Hash serialized configuration / Serileştirilmiş konfigürasyonun özetini al
+        
+        Args:
+            data: Serialized configuration / Serileştirilmiş konfigürasyon
+            
+        Returns:
+            Content digest / İçerik özeti
+        """
+        return hashlib.blake2b(data, digest_size=16).digest()
     
     def save_config(self) -> bool:
         """
@@ -70,14 +141,75 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise / Başarılı ise True, aksi halde False
         """
+        tmp_file = self.config_file + ".tmp"
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            data = self._serialize()
+            digest = self._digest(data)
+            
+            # Skip the write if nothing changed / Değişiklik yoksa yazmayı atla
+            if digest == self._last_saved_digest:
+                self._dirty = False
+                return True
+            
+            # Write to a sibling file, then swap it in atomically / Yan dosyaya yaz, sonra atomik olarak değiştir
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._last_saved_digest = digest
+            self._dirty = False
             return True
         except Exception as e:
-            print(f"Config saving error / Konfigürasyon kaydetme hatası: {e}")
+            logger.error("Config saving error / Konfigürasyon kaydetme hatası: %s", e)
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return False
     
+    def _commit(self) -> bool:
+        """
+        Record a change and save it unless batching / Değişikliği işaretle, toplu modda değilse kaydet
+        
+        Returns:
+            True if successful / Başarılı ise True
+        """
+        self._dirty = True
+        if not self._autosave:
+            return True
+        return self.save_config()
+    
+    def flush(self) -> bool:
+        """
+        Write pending changes to file / Bekleyen değişiklikleri dosyaya yaz
+        
+        Returns:
+            True if successful or nothing to write / Başarılı ise veya yazılacak bir şey yoksa True
+        """
+        if not self._dirty:
+            return True
+        return self.save_config()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer saving until the block exits / Kaydetmeyi blok bitene kadar ertele
+        
+        Usage / Kullanım:
+            with config_manager.batch():
+                config_manager.add_connection(...)
+                config_manager.set_setting(...)
+        """
+        previous = self._autosave
+        self._autosave = False
+        try:
+            yield self
+        finally:
+            self._autosave = previous
+            if previous:
+                self.flush()
+    
     def get_connections(self) -> List[Dict[str, Any]]:
         """
         Get all saved connections / Kayıtlı tüm bağlantıları al
@@ -85,7 +217,7 @@ class ConfigManager:
         Returns:
             List of connection dictionaries / Bağlantı sözlüklerinin listesi
         """
-        return self.config.get("connections", [])
+        return self._connections_list
     
     def add_connection(self, name: str, ip: str, user: str, port: int) -> bool:
         """
@@ -108,21 +240,58 @@ class ConfigManager:
                 "port": port
             }
             
-            # Check if connection already exists / Bağlantı zaten var mı kontrol et
-            connections = self.config.get("connections", [])
-            for i, conn in enumerate(connections):
-                if conn["name"] == name:
-                    connections[i] = connection
-                    break
-            else:
-                connections.append(connection)
+            self._upsert_connection(connection)
+            return self._commit()
+        except Exception as e:
+            logger.error("Add connection error / Bağlantı ekleme hatası: %s", e)
+            return False
+    
+    def add_connections(self, profiles: List[Dict[str, Any]]) -> bool:
+        """
+        Add or update several connection profiles with a single save / Birden fazla bağlantı profilini tek kayıtla ekle veya güncelle
+        
+        Args:
+            profiles: Dictionaries with name, ip, user and port / name, ip, user ve port içeren sözlükler
+            
+        Returns:
+            True if successful / Başarılı ise True
+        """
+        try:
+            # Validate everything before mutating / Değiştirmeden önce hepsini doğrula
+            connections = [
+                {
+                    "name": profile["name"],
+                    "ip": profile["ip"],
+                    "user": profile["user"],
+                    "port": int(profile["port"])
+                }
+                for profile in profiles
+            ]
             
-            self.config["connections"] = connections
-            return self.save_config()
+            for connection in connections:
+                self._upsert_connection(connection)
+            return self._commit()
         except Exception as e:
-            print(f"Add connection error / Bağlantı ekleme hatası: {e}")
+            logger.error("Add connections error / Bağlantıları ekleme hatası: %s", e)
             return False
     
+    def _upsert_connection(self, connection: Dict[str, Any]):
+        """
+        Insert or replace a connection in memory / Bağlantıyı bellekte ekle veya değiştir
+        
+        Args:
+            connection: Connection dictionary / Bağlantı sözlüğü
+        """
+        # Check if connection already exists / Bağlantı zaten var mı kontrol et
+        connections = self._connections_list
+        existing = self._conn_index.get(connection["name"])
+        if existing is not None:
+            connections[connections.index(existing)] = connection
+        else:
+            connections.append(connection)
+        
+        self._conn_index[connection["name"]] = connection
+    
     def remove_connection(self, name: str) -> bool:
         """
         Remove a connection profile / Bağlantı profili sil
@@ -134,11 +303,13 @@ class ConfigManager:
             True if successful / Başarılı ise True
         """
         try:
-            connections = self.config.get("connections", [])
-            self.config["connections"] = [conn for conn in connections if conn["name"] != name]
-            return self.save_config()
+            connection = self._conn_index.pop(name, None)
+            if connection is None:
+                return True
+            self._connections_list.remove(connection)
+            return self._commit()
         except Exception as e:
-            print(f"Remove connection error / Bağlantı silme hatası: {e}")
+            logger.error("Remove connection error / Bağlantı silme hatası: %s", e)
             return False
     
     def get_connection(self, name: str) -> Optional[Dict[str, Any]]:
@@ -151,11 +322,7 @@ class ConfigManager:
         Returns:
             Connection dictionary or None / Bağlantı sözlüğü veya None
         """
-        connections = self.config.get("connections", [])
-        for conn in connections:
-            if conn["name"] == name:
-                return conn
-        return None
+        return self._conn_index.get(name)
     
     def set_last_connection(self, name: str) -> bool:
         """
@@ -169,9 +336,9 @@ class ConfigManager:
         """
         try:
             self.config["last_connection"] = name
-            return self.save_config()
+            return self._commit()
         except Exception as e:
-            print(f"Set last connection error / Son bağlantı ayarlama hatası: {e}")
+            logger.error("Set last connection error / Son bağlantı ayarlama hatası: %s", e)
             return False
     
     def get_last_connection(self) -> Optional[str]:
@@ -194,8 +361,7 @@ class ConfigManager:
         Returns:
             Setting value / Ayar değeri
         """
-        settings = self.config.get("settings", {})
-        return settings.get(key, default)
+        return self._settings.get(key, default)
     
     def set_setting(self, key: str, value: Any) -> bool:
         """
@@ -209,12 +375,10 @@ class ConfigManager:
             True if successful / Başarılı ise True
         """
         try:
-            if "settings" not in self.config:
-                self.config["settings"] = {}
-            self.config["settings"][key] = value
-            return self.save_config()
+            self._settings[key] = value
+            return self._commit()
         except Exception as e:
-            print(f"Set setting error / Ayar ayarlama hatası: {e}")
+            logger.error("Set setting error / Ayar ayarlama hatası: %s", e)
             return False
     
     def get_connection_names(self) -> List[str]:
@@ -224,5 +388,4 @@ class ConfigManager:
         Returns:
             List of connection names / Bağlantı adlarının listesi
         """
-        connections = self.config.get("connections", [])
-        return [conn["name"] for conn in connections]
+        return list(self._conn_index)
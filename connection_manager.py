@@ -10,14 +10,33 @@ Author / Yazar: ensfur
 License / Lisans: MIT
 """
 
+import logging
 import paramiko
 import socket
-from typing import Optional, Callable, Tuple
+import threading
+from typing import Optional, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
     """SSH/SFTP connection management class / SSH/SFTP bağlantı yönetim sınıfı"""
     
+    # Seconds between SSH keepalive packets / SSH canlı tutma paketleri arası saniye
+    KEEPALIVE_INTERVAL = 30
+    
+    # SFTP channel flow control for large transfers / Büyük transferler için SFTP kanal akış kontrolü
+    SFTP_WINDOW_SIZE = 2 * 1024 * 1024   # 2MB
+    SFTP_MAX_PACKET_SIZE = 256 * 1024    # 256KB
+    
+    # TCP socket buffers for high-latency links / Yüksek gecikmeli bağlantılar için TCP soket tamponları
+    TCP_SEND_BUFFER = 4 * 1024 * 1024     # 4MB
+    TCP_RECEIVE_BUFFER = 4 * 1024 * 1024  # 4MB
+    
+    # SSH connections used by transfers, 1 keeps everything on the main one
+    # Transferlerin kullandığı SSH bağlantıları, 1 her şeyi ana bağlantıda tutar
+    PARALLEL_CONNECTIONS = 1
+    
     def __init__(self):
         """Initialize connection manager / Bağlantı yöneticisini başlat"""
         self.ssh_client: Optional[paramiko.SSHClient] = None
@@ -25,6 +44,23 @@ class ConnectionManager:
         self.current_connection: Optional[dict] = None
         self.is_connected = False
         
+        # Socket buffer sizes, start at the class defaults / Soket tampon boyutları, sınıf varsayılanlarıyla başlar
+        self.tcp_send_buffer = self.TCP_SEND_BUFFER
+        self.tcp_receive_buffer = self.TCP_RECEIVE_BUFFER
+        
+        # SSH connections per transfer batch, including the main one / Ana bağlantı dahil transfer başına SSH bağlantısı
+        self.parallel_connections = self.PARALLEL_CONNECTIONS
+        
+        # Separate SFTP channel for browsing and file operations, opened on first use
+        # Gezinme ve dosya işlemleri için ayrı SFTP kanalı, ilk kullanımda açılır
+        self._interactive_sftp: Optional[paramiko.SFTPClient] = None
+        self._interactive_lock = threading.Lock()
+        
+        # Extra SSH connections for transfers, kept for the session / Transferler için oturum boyunca tutulan ek SSH bağlantıları
+        self._parallel_clients: List[paramiko.SSHClient] = []
+        self._parallel_lock = threading.Lock()
+        self._credentials: Optional[Tuple[str, str, str, int, int]] = None
+        
         # Callbacks for connection events / Bağlantı olayları için geri çağırma fonksiyonları
         self.on_connect_callback: Optional[Callable] = None
         self.on_disconnect_callback: Optional[Callable] = None
@@ -61,29 +97,21 @@ class ConnectionManager:
             Tuple of (success, error_message) / (başarı, hata_mesajı) demeti
         """
         try:
+            # Reuse the live session for the same target / Aynı hedef için canlı oturumu yeniden kullan
+            if self.is_connected and self._is_current_target(ip, username, port) and self._transport_is_active():
+                if self.on_connect_callback:
+                    self.on_connect_callback()
+                return True, ""
+            
             # Disconnect if already connected / Zaten bağlıysa bağlantıyı kes
             if self.is_connected:
                 self.disconnect()
             
             # Create SSH client / SSH istemcisi oluştur
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Connect to SSH server / SSH sunucusuna bağlan
-            self.ssh_client.connect(
-                hostname=ip,
-                port=port,
-                username=username,
-                password=password,
-                timeout=timeout
-            )
+            self.ssh_client = self._open_ssh_client(ip, username, password, port, timeout)
             
-            # Open SFTP session / SFTP oturumu aç
-            self.sftp_client = self.ssh_client.open_sftp()
-            
-            # Optimize for large file transfers / Büyük dosya transferleri için optimize et
-            self.sftp_client.MAX_REQUEST_SIZE = 32768 * 4  # 128KB
-            self.sftp_client.MAX_PACKET_SIZE = 32768 * 4   # 128KB
+            # Open SFTP session with a large window / Geniş pencereli SFTP oturumu aç
+            self.sftp_client = self._open_sftp(self.ssh_client.get_transport())
             
             # Store connection info / Bağlantı bilgilerini sakla
             self.current_connection = {
@@ -92,6 +120,8 @@ class ConnectionManager:
                 "port": port,
                 "name": f"{username}@{ip}:{port}"
             }
+            # Needed to open parallel connections / Paralel bağlantılar açmak için gerekli
+            self._credentials = (ip, username, password, port, timeout)
             
             self.is_connected = True
             
@@ -134,6 +164,14 @@ class ConnectionManager:
     def disconnect(self):
         """Close SSH/SFTP connection / SSH/SFTP bağlantısını kapat"""
         try:
+            with self._interactive_lock:
+                if self._interactive_sftp:
+                    self._interactive_sftp.close()
+                    self._interactive_sftp = None
+            
+            self._close_parallel_clients()
+            self._credentials = None
+            
             if self.sftp_client:
                 self.sftp_client.close()
                 self.sftp_client = None
@@ -150,7 +188,7 @@ class ConnectionManager:
                 self.on_disconnect_callback()
                 
         except Exception as e:
-            print(f"Disconnect error / Bağlantı kesme hatası: {e}")
+            logger.error("Disconnect error / Bağlantı kesme hatası: %s", e)
     
     def is_connected_to_server(self) -> bool:
         """
@@ -170,14 +208,40 @@ class ConnectionManager:
         """
         return self.current_connection
     
-    def get_sftp_client(self) -> Optional[paramiko.SFTPClient]:
+    def get_sftp_client(self, interactive: bool = False) -> Optional[paramiko.SFTPClient]:
         """
         Get SFTP client instance / SFTP istemci örneğini al
         
+        The interactive client is a second channel on the same transport, so
+        listings, renames and deletes do not queue behind bulk transfers.
+        It may open the channel, so call it off the UI thread, and keep each
+        call on a single thread: the client is not safe to share.
+        Etkileşimli istemci aynı transport üzerinde ikinci bir kanaldır, böylece
+        listeleme, yeniden adlandırma ve silme toplu transferlerin arkasında beklemez.
+        Kanalı açabilir, bu yüzden arayüz thread'i dışında ve tek bir thread'den
+        çağırın: istemci paylaşılmaya uygun değildir.
+        
+        Args:
+            interactive: Use the channel for GUI operations / GUI işlemleri için kanalı kullan
+            
         Returns:
-            SFTP client or None / SFTP istemci veya None
+            SFTP client, or None if not connected or the channel cannot be opened
+            SFTP istemci, bağlı değilse veya kanal açılamazsa None
         """
-        return self.sftp_client if self.is_connected else None
+        if not self.is_connected:
+            return None
+        if not interactive:
+            return self.sftp_client
+        
+        with self._interactive_lock:
+            if self._interactive_sftp is None or self._interactive_sftp.get_channel().closed:
+                try:
+                    self._interactive_sftp = self.open_sftp_channel()
+                except Exception as e:
+                    logger.warning("SFTP channel error / SFTP kanal hatası: %s", e)
+                    self._interactive_sftp = None
+            # Never hand out the transfer client instead / Yerine asla transfer istemcisini verme
+            return self._interactive_sftp
     
     def get_ssh_client(self) -> Optional[paramiko.SSHClient]:
         """
@@ -188,6 +252,250 @@ class ConnectionManager:
         """
         return self.ssh_client if self.is_connected else None
     
+    def get_transport(self) -> Optional[paramiko.Transport]:
+        """
+        Get underlying SSH transport / Alttaki SSH transport nesnesini al
+        
+        Returns:
+            SSH transport or None / SSH transport veya None
+        """
+        if not self.is_connected or not self.ssh_client:
+            return None
+        return self.ssh_client.get_transport()
+    
+    def open_sftp_channel(self, transport: Optional[paramiko.Transport] = None) -> Optional[paramiko.SFTPClient]:
+        """
+        Open an additional SFTP channel on the existing transport / Mevcut transport üzerinde ek SFTP kanalı aç
+        
+        The caller owns the returned client and must close it.
+        Dönen istemci çağırana aittir ve kapatılmalıdır.
+        
+        Args:
+            transport: Transport to use, the main one by default / Kullanılacak transport, varsayılan olarak ana transport
+            
+        Returns:
+            New SFTP client or None / Yeni SFTP istemci veya None
+        """
+        transport = transport or self.get_transport()
+        if not transport or not transport.is_active():
+            return None
+        return self._open_sftp(transport)
+    
+    def set_parallel_connections(self, count: int):
+        """
+        Set how many SSH connections transfers may use / Transferlerin kullanabileceği SSH bağlantı sayısını ayarla
+        
+        A single TCP stream is limited by its own congestion window on
+        long, fast links; channels spread over several connections are not.
+        Tek bir TCP akışı uzun ve hızlı bağlantılarda kendi tıkanıklık
+        penceresiyle sınırlıdır; birkaç bağlantıya dağılan kanallar değildir.
+        
+        Args:
+            count: Number of connections including the main one / Ana bağlantı dahil bağlantı sayısı
+        """
+        if count <= 0:
+            raise ValueError("count must be positive / count pozitif olmalı")
+        self.parallel_connections = int(count)
+    
+    def get_parallel_transports(self) -> List[paramiko.Transport]:
+        """
+        Get transports to spread transfer channels over / Transfer kanallarının dağıtılacağı transportları al
+        
+        The main transport comes first. Extra connections are opened on
+        first use and kept until disconnect; fewer are returned if the
+        server refuses more.
+        Ana transport ilk sıradadır. Ek bağlantılar ilk kullanımda açılır ve
+        bağlantı kesilene kadar tutulur; sunucu daha fazlasını reddederse
+        daha az döner.
+        
+        Returns:
+            List of active transports / Aktif transportların listesi
+        """
+        transport = self.get_transport()
+        if not transport or not transport.is_active():
+            return []
+        
+        with self._parallel_lock:
+            # Drop connections that died since the last transfer / Son transferden beri kopan bağlantıları at
+            alive = []
+            for client in self._parallel_clients:
+                client_transport = client.get_transport()
+                if client_transport and client_transport.is_active():
+                    alive.append(client)
+                else:
+                    client.close()
+            self._parallel_clients = alive
+            
+            while self._credentials and len(self._parallel_clients) < self.parallel_connections - 1:
+                try:
+                    self._parallel_clients.append(self._open_ssh_client(*self._credentials))
+                except Exception as e:
+                    logger.warning("Parallel connection error / Paralel bağlantı hatası: %s", e)
+                    break
+            
+            return [transport] + [client.get_transport() for client in self._parallel_clients]
+    
+    def _close_parallel_clients(self):
+        """Close extra transfer connections / Ek transfer bağlantılarını kapat"""
+        with self._parallel_lock:
+            for client in self._parallel_clients:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+            self._parallel_clients = []
+    
+    def _open_ssh_client(self, ip: str, username: str, password: str, port: int, timeout: int) -> paramiko.SSHClient:
+        """
+        Open an authenticated SSH connection / Kimliği doğrulanmış SSH bağlantısı aç
+        
+        Args:
+            ip: IP address / IP adresi
+            username: Username / Kullanıcı adı
+            password: Password / Şifre
+            port: SSH port / SSH portu
+            timeout: Connection timeout / Bağlantı zaman aşımı
+            
+        Returns:
+            Connected SSH client / Bağlı SSH istemci
+        """
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
+        # Connect to SSH server over our tuned socket / Ayarlanmış soketimiz üzerinden SSH sunucusuna bağlan
+        sock = self._open_socket(ip, port, timeout)
+        try:
+            ssh_client.connect(
+                hostname=ip,
+                port=port,
+                username=username,
+                password=password,
+                timeout=timeout,
+                sock=sock
+            )
+        except Exception:
+            sock.close()
+            raise
+        
+        # Keep idle connections from being dropped / Boştaki bağlantıların düşmesini önle
+        ssh_client.get_transport().set_keepalive(self.KEEPALIVE_INTERVAL)
+        return ssh_client
+    
+    def configure_tcp_buffers(self, send_size: int, receive_size: int) -> bool:
+        """
+        Set TCP buffer sizes for new connections and the active one / Yeni bağlantılar ve aktif bağlantı için TCP tampon boyutlarını ayarla
+        
+        Args:
+            send_size: SO_SNDBUF size in bytes / Bayt cinsinden SO_SNDBUF boyutu
+            receive_size: SO_RCVBUF size in bytes / Bayt cinsinden SO_RCVBUF boyutu
+            
+        Returns:
+            True unless applying to the active connection failed / Aktif bağlantıya uygulama başarısız olmadıkça True
+        """
+        if send_size <= 0 or receive_size <= 0:
+            raise ValueError("TCP buffer sizes must be positive / TCP tampon boyutları pozitif olmalı")
+        
+        self.tcp_send_buffer = int(send_size)
+        self.tcp_receive_buffer = int(receive_size)
+        
+        transport = self.get_transport()
+        if not transport:
+            return True
+        return self._tune_socket(transport.sock, send_size, receive_size)
+    
+    def _open_socket(self, host: str, port: int, timeout: float) -> socket.socket:
+        """
+        Open a TCP connection tuned before the handshake / El sıkışmadan önce ayarlanmış TCP bağlantısı aç
+        
+        The receive buffer has to be set before connect, since the TCP
+        window scale is agreed on during the handshake.
+        TCP pencere ölçeği el sıkışma sırasında belirlendiği için alma
+        tamponu bağlanmadan önce ayarlanmalıdır.
+        
+        Args:
+            host: Host name or IP address / Sunucu adı veya IP adresi
+            port: TCP port / TCP portu
+            timeout: Connect timeout in seconds / Saniye cinsinden bağlanma zaman aşımı
+            
+        Returns:
+            Connected socket / Bağlı soket
+        """
+        last_error: Optional[OSError] = None
+        for family, socktype, proto, _, address in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
+            sock = socket.socket(family, socktype, proto)
+            try:
+                self._tune_socket(sock, self.tcp_send_buffer, self.tcp_receive_buffer)
+                sock.settimeout(timeout)
+                sock.connect(address)
+                return sock
+            except OSError as e:
+                sock.close()
+                last_error = e
+        raise last_error or OSError(f"No address for / Adres bulunamadı: {host}")
+    
+    def _tune_socket(self, sock, send_size: int, receive_size: int) -> bool:
+        """
+        Apply buffer sizes and disable Nagle on a socket / Sokete tampon boyutlarını uygula ve Nagle'ı kapat
+        
+        Args:
+            sock: TCP socket / TCP soketi
+            send_size: SO_SNDBUF size in bytes / Bayt cinsinden SO_SNDBUF boyutu
+            receive_size: SO_RCVBUF size in bytes / Bayt cinsinden SO_RCVBUF boyutu
+            
+        Returns:
+            True if applied / Uygulandıysa True
+        """
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_size)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return True
+        except (OSError, AttributeError) as e:
+            # Proxy or non-TCP sockets may not support these / Proxy veya TCP olmayan soketler desteklemeyebilir
+            logger.warning("Socket tuning error / Soket ayarlama hatası: %s", e)
+            return False
+    
+    def _open_sftp(self, transport: paramiko.Transport) -> paramiko.SFTPClient:
+        """
+        Open SFTP channel tuned for throughput / Verim için ayarlanmış SFTP kanalı aç
+        
+        Args:
+            transport: SSH transport / SSH transport
+            
+        Returns:
+            SFTP client / SFTP istemci
+        """
+        return paramiko.SFTPClient.from_transport(
+            transport,
+            window_size=self.SFTP_WINDOW_SIZE,
+            max_packet_size=self.SFTP_MAX_PACKET_SIZE
+        )
+    
+    def _is_current_target(self, ip: str, username: str, port: int) -> bool:
+        """
+        Check if target matches the current connection / Hedefin mevcut bağlantıyla eşleşip eşleşmediğini kontrol et
+        
+        Args:
+            ip: IP address / IP adresi
+            username: Username / Kullanıcı adı
+            port: SSH port / SSH portu
+            
+        Returns:
+            True if same target / Aynı hedef ise True
+        """
+        conn = self.current_connection
+        return bool(conn) and conn["ip"] == ip and conn["username"] == username and conn["port"] == port
+    
+    def _transport_is_active(self) -> bool:
+        """
+        Check if the SSH transport is still active / SSH transport'un hala aktif olup olmadığını kontrol et
+        
+        Returns:
+            True if active / Aktif ise True
+        """
+        transport = self.ssh_client.get_transport() if self.ssh_client else None
+        return bool(transport and transport.is_active())
+    
     def test_connection(self) -> bool:
         """
         Test if connection is still alive / Bağlantının hala aktif olup olmadığını test et
@@ -199,8 +507,10 @@ class ConnectionManager:
             return False
         
         try:
-            # Try to get remote directory listing / Uzak dizin listesini almaya çalış
-            self.sftp_client.listdir("/")
+            # Probe the transport with an SSH_MSG_IGNORE packet / Transport'u SSH_MSG_IGNORE paketi ile yokla
+            if not self._transport_is_active():
+                raise paramiko.SSHException("Transport is not active")
+            self.ssh_client.get_transport().send_ignore()
             return True
         except:
             # Connection is dead, disconnect / Bağlantı ölmüş, bağlantıyı kes
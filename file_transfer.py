@@ -10,16 +10,64 @@ Author / Yazar: ensfur
 License / Lisans: MIT
 """
 
+import io
+import itertools
+import logging
 import os
+import posixpath
+import queue
+import shlex
+import tarfile
 import time
 import threading
-from typing import Optional, Callable, List, Tuple
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from stat import S_ISDIR
+from typing import Optional, Callable, Deque, List, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class FileTransfer:
     """File transfer management class / Dosya transfer yönetim sınıfı"""
     
+    # Bytes read per block when streaming files / Dosya aktarımında blok başına okunan bayt
+    BLOCK_SIZE = 256 * 1024  # 256KB
+    
+    # Files transferred concurrently, one SFTP channel each / Eşzamanlı transfer edilen dosya sayısı, her biri için bir SFTP kanalı
+    MAX_PARALLEL_TRANSFERS = 4
+    
+    # Files at least this big are split into ranges over several channels / Bu boyuttan büyük dosyalar birden fazla kanala bölünür
+    LARGE_FILE_THRESHOLD = 64 * 1024 * 1024  # 64MB
+    CHUNK_WORKERS = 4
+    
+    # SFTP channels a batch may hold per SSH connection; OpenSSH allows 10 sessions per connection
+    # by default and browsing, prefetch and deletes need the rest
+    # Bir işlemin SSH bağlantısı başına tutabileceği SFTP kanalı; OpenSSH varsayılan olarak bağlantı
+    # başına 10 oturuma izin verir, gezinme, önden yükleme ve silme geri kalanına ihtiyaç duyar
+    CHANNELS_PER_CONNECTION = 4
+    
+    # SFTP read requests kept in flight per file / Dosya başına yolda tutulan SFTP okuma istekleri
+    MAX_CONCURRENT_REQUESTS = 64
+    
+    # Largest SFTP read request; OpenSSH answers at most 255KB, larger reads come back short
+    # En büyük SFTP okuma isteği; OpenSSH en fazla 255KB döndürür, daha büyük okumalar eksik gelir
+    MAX_READ_REQUEST_SIZE = 255 * 1024
+    
+    # Batches of many small files go through one tar stream over SSH / Çok sayıda küçük dosya SSH üzerinden tek tar akışıyla gider
+    TAR_MIN_FILES = 32
+    TAR_MAX_MEDIAN_SIZE = 1024 * 1024  # 1MB
+    
+    # Suffix for downloads in progress / Devam eden indirmeler için sonek
+    PARTIAL_SUFFIX = ".part"
+    
+    # Seconds between progress updates / İlerleme güncellemeleri arasındaki saniye
+    PROGRESS_INTERVAL = 0.1
+    
+    # Size units indexed by bit length / Bit uzunluğuna göre dizinlenen boyut birimleri
+    _SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024**2), ("GB", 1024**3), ("TB", 1024**4))
+    
     def __init__(self, connection_manager):
         """
         Initialize file transfer manager / Dosya transfer yöneticisini başlat
@@ -29,9 +77,14 @@ class FileTransfer:
         """
         self.connection_manager = connection_manager
         
+        # Tuning, starts at the class defaults / Ayarlar, sınıf varsayılanlarıyla başlar
+        self.block_size = self.BLOCK_SIZE
+        self.max_concurrent_requests = self.MAX_CONCURRENT_REQUESTS
+        self.max_parallel_transfers = self.MAX_PARALLEL_TRANSFERS
+        
         # Transfer state / Transfer durumu
-        self.transfer_in_progress = False
-        self.transfer_cancelled = False
+        self._active_event = threading.Event()
+        self._cancel_event = threading.Event()
         self.current_transfer_thread: Optional[threading.Thread] = None
         
         # Progress callbacks / İlerleme geri çağırma fonksiyonları
@@ -40,8 +93,12 @@ class FileTransfer:
         self.speed_callback: Optional[Callable] = None
         self.eta_callback: Optional[Callable] = None
         
+        # Latest (fraction, bytes, start) read by the reporter thread / Raporlayıcı thread'in okuduğu son (oran, bayt, başlangıç)
+        self._progress_state: Optional[Tuple[float, int, float]] = None
+        
         # Transfer log / Transfer günlüğü
-        self.transfer_log: List[dict] = []
+        # Keep only last 100 entries / Sadece son 100 kaydı tut
+        self.transfer_log: Deque[dict] = deque(maxlen=100)
     
     def set_progress_callbacks(self,
                              progress_cb: Optional[Callable] = None,
@@ -62,6 +119,31 @@ class FileTransfer:
         self.speed_callback = speed_cb
         self.eta_callback = eta_cb
     
+    def set_transfer_options(self,
+                             buffer_size: Optional[int] = None,
+                             max_concurrent_requests: Optional[int] = None,
+                             max_parallel_transfers: Optional[int] = None):
+        """
+        Tune request size, pipelining depth and parallelism / İstek boyutunu, boru hattı derinliğini ve paralelliği ayarla
+        
+        Args:
+            buffer_size: Bytes per read/write request / İstek başına bayt
+            max_concurrent_requests: SFTP requests kept in flight per file / Dosya başına yolda tutulan SFTP istekleri
+            max_parallel_transfers: Files transferred at once, one SFTP channel each / Aynı anda transfer edilen dosya, her biri için bir SFTP kanalı
+        """
+        if buffer_size is not None:
+            if buffer_size <= 0:
+                raise ValueError("buffer_size must be positive / buffer_size pozitif olmalı")
+            self.block_size = int(buffer_size)
+        if max_concurrent_requests is not None:
+            if max_concurrent_requests <= 0:
+                raise ValueError("max_concurrent_requests must be positive / max_concurrent_requests pozitif olmalı")
+            self.max_concurrent_requests = int(max_concurrent_requests)
+        if max_parallel_transfers is not None:
+            if max_parallel_transfers <= 0:
+                raise ValueError("max_parallel_transfers must be positive / max_parallel_transfers pozitif olmalı")
+            self.max_parallel_transfers = int(max_parallel_transfers)
+    
     def is_transfer_in_progress(self) -> bool:
         """
         Check if transfer is in progress / Transfer devam edip etmediğini kontrol et
@@ -69,11 +151,11 @@ class FileTransfer:
         Returns:
             True if transfer is in progress / Transfer devam ediyorsa True
         """
-        return self.transfer_in_progress
+        return self._active_event.is_set()
     
     def cancel_transfer(self):
         """Cancel current transfer / Mevcut transferi iptal et"""
-        self.transfer_cancelled = True
+        self._cancel_event.set()
     
     def upload_file(self, local_path: str, remote_path: str) -> bool:
         """
@@ -86,59 +168,67 @@ class FileTransfer:
         Returns:
             True if successful / Başarılı ise True
         """
-        if not self.connection_manager.is_connected_to_server():
-            return False
-        
-        sftp_client = self.connection_manager.get_sftp_client()
+        sftp_client = self._get_sftp_client()
         if not sftp_client:
             return False
         
+        start_time = time.monotonic()
+        
+        def on_progress(transferred, file_size):
+            fraction = transferred / file_size if file_size else 1.0
+            self._report_progress(fraction, transferred, start_time)
+        
+        with self._progress_reporter():
+            return self._upload_file(sftp_client, local_path, remote_path, on_progress)
+    
+    def _upload_file(self, sftp_client, local_path: str, remote_path: str,
+                     on_progress: Optional[Callable] = None, file_size: Optional[int] = None,
+                     range_channels: Optional[list] = None) -> bool:
+        """
+        Upload single file over the given SFTP client / Verilen SFTP istemci ile tek dosya yükle
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            local_path: Local file path / Yerel dosya yolu
+            remote_path: Remote file path / Uzak dosya yolu
+            on_progress: Called with (bytes_transferred, file_size) / (aktarılan_bayt, dosya_boyutu) ile çağrılır
+            file_size: Known size, skips the stat call / Bilinen boyut, stat çağrısını atlar
+            range_channels: Extra channels for large files, opened here if None / Büyük dosyalar için ek kanallar, None ise burada açılır
+            
+        Returns:
+            True if successful / Başarılı ise True
+        """
         try:
-            file_size = os.path.getsize(local_path)
-            uploaded = 0
-            start_time = time.time()
+            if file_size is None:
+                file_size = os.path.getsize(local_path)
+            
+            is_cancelled = self._cancel_event.is_set
             
             def callback(bytes_transferred):
-                nonlocal uploaded
-                if self.transfer_cancelled:
+                if is_cancelled():
                     raise Exception("Transfer cancelled / Transfer iptal edildi")
                 
-                uploaded = bytes_transferred  # Paramiko gives total bytes / Paramiko toplam bayt sayısını verir
-                
-                if self.progress_callback:
-                    progress = (uploaded / file_size) * 100
-                    self.progress_callback(progress)
-                
-                # Calculate speed and ETA / Hız ve ETA hesapla
-                elapsed = time.time() - start_time
-                if elapsed > 0:
-                    speed = uploaded / elapsed
-                    speed_str = self.format_size(speed) + "/s"
-                    
-                    if self.speed_callback:
-                        self.speed_callback(speed_str)
-                    
-                    if self.eta_callback:
-                        eta = (file_size - uploaded) / speed if speed > 0 else 0
-                        eta_str = f"ETA: {self.format_time(eta)}"
-                        self.eta_callback(eta_str)
+                if on_progress:
+                    # A failing progress handler must not abort the transfer / Hatalı ilerleme işleyicisi transferi durdurmamalı
+                    try:
+                        on_progress(bytes_transferred, file_size)
+                    except Exception as e:
+                        logger.debug("Progress callback error / İlerleme geri çağırma hatası: %s", e)
             
             # Upload with progress tracking / İlerleme takibi ile yükle
-            try:
-                sftp_client.put(local_path, remote_path, callback=callback, confirm=False)
-            except Exception as e:
-                # Fallback without callback if callback causes issues / Callback sorun çıkarırsa callback olmadan dene
-                if "callback" in str(e).lower():
-                    sftp_client.put(local_path, remote_path, confirm=False)
-                    if self.progress_callback:
-                        self.progress_callback(100)
-                else:
-                    raise e
+            if file_size >= self.LARGE_FILE_THRESHOLD:
+                self._upload_file_chunked(sftp_client, local_path, remote_path, file_size, callback, range_channels)
+            else:
+                with open(local_path, 'rb') as local_file, sftp_client.open(remote_path, 'wb') as remote_file:
+                    # Don't wait for each write ACK / Her yazma onayını bekleme
+                    remote_file.set_pipelined(True)
+                    self._advise_sequential(local_file)
+                    self._copy_stream(local_file, remote_file, callback)
             
             return True
             
         except Exception as e:
-            print(f"Upload error / Yükleme hatası: {e}")
+            logger.error("Upload error / Yükleme hatası: %s", e)
             return False
     
     def download_file(self, remote_path: str, local_path: str) -> bool:
@@ -152,61 +242,423 @@ class FileTransfer:
         Returns:
             True if successful / Başarılı ise True
         """
-        if not self.connection_manager.is_connected_to_server():
-            return False
-        
-        sftp_client = self.connection_manager.get_sftp_client()
+        sftp_client = self._get_sftp_client()
         if not sftp_client:
             return False
         
+        start_time = time.monotonic()
+        
+        def on_progress(transferred, file_size):
+            fraction = transferred / file_size if file_size else 1.0
+            self._report_progress(fraction, transferred, start_time)
+        
+        with self._progress_reporter():
+            return self._download_file(sftp_client, remote_path, local_path, on_progress)
+    
+    def _download_file(self, sftp_client, remote_path: str, local_path: str,
+                       on_progress: Optional[Callable] = None, file_size: Optional[int] = None,
+                       range_channels: Optional[list] = None) -> bool:
+        """
+        Download single file over the given SFTP client / Verilen SFTP istemci ile tek dosya indir
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            remote_path: Remote file path / Uzak dosya yolu
+            local_path: Local file path / Yerel dosya yolu
+            on_progress: Called with (bytes_transferred, file_size) / (aktarılan_bayt, dosya_boyutu) ile çağrılır
+            file_size: Known size, saves a stat round trip / Bilinen boyut, bir stat gidiş dönüşünü önler
+            range_channels: Extra channels for large files, opened here if None / Büyük dosyalar için ek kanallar, None ise burada açılır
+            
+        Returns:
+            True if successful / Başarılı ise True
+        """
         try:
-            file_size = sftp_client.stat(remote_path).st_size
-            downloaded = 0
-            start_time = time.time()
+            if file_size is None:
+                file_size = sftp_client.stat(remote_path).st_size
+            
+            is_cancelled = self._cancel_event.is_set
             
             def callback(bytes_transferred):
-                nonlocal downloaded
-                if self.transfer_cancelled:
+                if is_cancelled():
                     raise Exception("Transfer cancelled / Transfer iptal edildi")
                 
-                downloaded = bytes_transferred  # Paramiko gives total bytes / Paramiko toplam bayt sayısını verir
-                
-                if self.progress_callback:
-                    progress = (downloaded / file_size) * 100
-                    self.progress_callback(progress)
-                
-                # Calculate speed and ETA / Hız ve ETA hesapla
-                elapsed = time.time() - start_time
-                if elapsed > 0:
-                    speed = downloaded / elapsed
-                    speed_str = self.format_size(speed) + "/s"
-                    
-                    if self.speed_callback:
-                        self.speed_callback(speed_str)
-                    
-                    if self.eta_callback:
-                        eta = (file_size - downloaded) / speed if speed > 0 else 0
-                        eta_str = f"ETA: {self.format_time(eta)}"
-                        self.eta_callback(eta_str)
+                if on_progress:
+                    # A failing progress handler must not abort the transfer / Hatalı ilerleme işleyicisi transferi durdurmamalı
+                    try:
+                        on_progress(bytes_transferred, file_size)
+                    except Exception as e:
+                        logger.debug("Progress callback error / İlerleme geri çağırma hatası: %s", e)
+            
+            # Stage next to the target, then rename into place / Hedefin yanına indir, sonra yerine taşı
+            part_path = local_path + self.PARTIAL_SUFFIX
             
             # Download with progress tracking / İlerleme takibi ile indir
             try:
-                sftp_client.get(remote_path, local_path, callback=callback)
-            except Exception as e:
-                # Fallback without callback if callback causes issues / Callback sorun çıkarırsa callback olmadan dene
-                if "callback" in str(e).lower():
-                    sftp_client.get(remote_path, local_path)
-                    if self.progress_callback:
-                        self.progress_callback(100)
+                if file_size >= self.LARGE_FILE_THRESHOLD:
+                    self._download_file_chunked(sftp_client, remote_path, part_path, file_size, callback, range_channels)
                 else:
-                    raise e
+                    with sftp_client.open(remote_path, 'rb') as remote_file, open(part_path, 'wb') as local_file:
+                        # Keep read requests in flight ahead of us / Okuma isteklerini önceden gönder
+                        remote_file.MAX_REQUEST_SIZE = self._read_request_size()
+                        remote_file.prefetch(file_size, self.max_concurrent_requests)
+                        self._copy_stream(remote_file, local_file, callback)
+            except Exception:
+                self._remove_partial(part_path)
+                raise
             
+            os.replace(part_path, local_path)
             return True
             
         except Exception as e:
-            print(f"Download error / İndirme hatası: {e}")
+            logger.error("Download error / İndirme hatası: %s", e)
             return False
     
+    def _remove_partial(self, path: str):
+        """
+        Remove an unfinished download / Tamamlanmamış indirmeyi sil
+        
+        Args:
+            path: Partial file path / Yarım dosya yolu
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _upload_file_chunked(self, sftp_client, local_path: str, remote_path: str,
+                             file_size: int, callback: Callable, range_channels: Optional[list] = None):
+        """
+        Upload a large file as parallel byte ranges / Büyük dosyayı paralel bayt aralıkları olarak yükle
+        
+        Ranges are written to a partial file that replaces the target only
+        once every range arrived, so a failed upload never leaves holes in it.
+        Aralıklar, hepsi ulaştıktan sonra hedefin yerine geçen yarım bir
+        dosyaya yazılır; böylece başarısız yükleme hedefte boşluk bırakmaz.
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            local_path: Local file path / Yerel dosya yolu
+            remote_path: Remote file path / Uzak dosya yolu
+            file_size: File size in bytes / Bayt cinsinden dosya boyutu
+            callback: Called with total bytes transferred / Aktarılan toplam bayt ile çağrılır
+            range_channels: Extra channels, opened here if None / Ek kanallar, None ise burada açılır
+        """
+        part_path = remote_path + self.PARTIAL_SUFFIX
+        
+        def upload_range(channel, start, end, report):
+            with open(local_path, 'rb') as local_file, channel.open(part_path, 'r+b') as remote_file:
+                remote_file.set_pipelined(True)
+                self._advise_sequential(local_file, start, end - start)
+                local_file.seek(start)
+                remote_file.seek(start)
+                view = memoryview(bytearray(self.block_size))
+                remaining = end - start
+                while remaining > 0:
+                    count = local_file.readinto(view[:min(self.block_size, remaining)])
+                    if not count:
+                        break
+                    remote_file.write(view[:count])
+                    remaining -= count
+                    report(count)
+        
+        try:
+            # Create or truncate the partial file first / Önce yarım dosyayı oluştur veya sıfırla
+            with sftp_client.open(part_path, 'wb'):
+                pass
+            self._transfer_ranges(sftp_client, file_size, callback, upload_range, range_channels)
+            sftp_client.posix_rename(part_path, remote_path)
+        except Exception:
+            try:
+                sftp_client.remove(part_path)
+            except Exception:
+                pass
+            raise
+    
+    def _download_file_chunked(self, sftp_client, remote_path: str, local_path: str,
+                               file_size: int, callback: Callable, range_channels: Optional[list] = None):
+        """
+        Download a large file as parallel byte ranges / Büyük dosyayı paralel bayt aralıkları olarak indir
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            remote_path: Remote file path / Uzak dosya yolu
+            local_path: Local file path / Yerel dosya yolu
+            file_size: File size in bytes / Bayt cinsinden dosya boyutu
+            callback: Called with total bytes transferred / Aktarılan toplam bayt ile çağrılır
+            range_channels: Extra channels, opened here if None / Ek kanallar, None ise burada açılır
+        """
+        # Preallocate the target so ranges can be written in place / Aralıkların yerinde yazılabilmesi için hedefi önceden ayır
+        with open(local_path, 'wb') as local_file:
+            local_file.truncate(file_size)
+        
+        def download_range(channel, start, end, report):
+            # One block per read request, so readv never splits off a runt / Okuma isteği başına bir blok, böylece readv küçük parça ayırmaz
+            step = self._read_request_size()
+            blocks = [(offset, min(step, end - offset)) for offset in range(start, end, step)]
+            with channel.open(remote_path, 'rb') as remote_file, open(local_path, 'r+b') as local_file:
+                remote_file.MAX_REQUEST_SIZE = step
+                local_file.seek(start)
+                for data in remote_file.readv(blocks, self.max_concurrent_requests):
+                    local_file.write(data)
+                    report(len(data))
+        
+        self._transfer_ranges(sftp_client, file_size, callback, download_range, range_channels)
+    
+    def _read_request_size(self) -> int:
+        """
+        Size of SFTP read requests instead of paramiko's 32KB default / Paramiko'nun 32KB varsayılanı yerine SFTP okuma isteği boyutu
+        
+        Fewer, larger requests mean fewer round trips and fewer Python
+        level copies per megabyte.
+        Daha az ve daha büyük istek, megabayt başına daha az gidiş dönüş
+        ve daha az Python seviyesinde kopya demektir.
+        
+        Returns:
+            Request size in bytes / Bayt cinsinden istek boyutu
+        """
+        return min(self.block_size, self.MAX_READ_REQUEST_SIZE)
+    
+    def _transfer_ranges(self, sftp_client, file_size: int, callback: Callable, worker: Callable,
+                         range_channels: Optional[list] = None):
+        """
+        Run a range worker per SFTP channel and merge progress / Her SFTP kanalı için aralık işçisi çalıştır ve ilerlemeyi birleştir
+        
+        report() raises once the transfer is cancelled or another range
+        failed, so every worker stops at its next block.
+        report() transfer iptal edildiğinde veya başka bir aralık başarısız
+        olduğunda hata fırlatır, böylece her işçi bir sonraki blokta durur.
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            file_size: File size in bytes / Bayt cinsinden dosya boyutu
+            callback: Called with total bytes transferred / Aktarılan toplam bayt ile çağrılır
+            worker: Called as worker(channel, start, end, report) / worker(kanal, başlangıç, bitiş, bildir) olarak çağrılır
+            range_channels: Extra channels, opened here if None / Ek kanallar, None ise burada açılır
+        """
+        if range_channels is None:
+            channels = self._open_worker_channels(sftp_client, self.CHUNK_WORKERS)
+            owned = channels[1:]
+        else:
+            channels = [sftp_client] + list(range_channels)
+            owned = []
+        try:
+            chunk_size = max(1, -(-file_size // len(channels)))
+            ranges = [(start, min(start + chunk_size, file_size)) for start in range(0, file_size, chunk_size)]
+            
+            lock = threading.Lock()
+            stop = threading.Event()
+            transferred = 0
+            first_error: List[Exception] = []
+            
+            def report(count):
+                nonlocal transferred
+                if stop.is_set() or self._cancel_event.is_set():
+                    raise Exception("Transfer stopped / Transfer durduruldu")
+                with lock:
+                    transferred += count
+                    total = transferred
+                callback(total)
+            
+            def run(channel, start, end):
+                try:
+                    worker(channel, start, end, report)
+                except Exception as e:
+                    # Stop the sibling ranges too, keeping the error that started it
+                    # Kardeş aralıkları da durdur, bunu başlatan hatayı sakla
+                    with lock:
+                        if not stop.is_set():
+                            first_error.append(e)
+                            stop.set()
+                    raise
+            
+            with ThreadPoolExecutor(max_workers=max(1, len(ranges))) as executor:
+                futures = [executor.submit(run, channel, start, end)
+                           for channel, (start, end) in zip(channels, ranges)]
+            if first_error:
+                raise first_error[0]
+            for future in futures:
+                future.result()
+        finally:
+            # Close range channels opened here / Burada açılan aralık kanallarını kapat
+            for channel in owned:
+                try:
+                    channel.close()
+                except Exception:
+                    pass
+    
+    def _report_progress(self, fraction: float, bytes_done: int, start_time: float):
+        """
+        Record the latest progress for the reporter thread / Raporlayıcı thread için son ilerlemeyi kaydet
+        
+        Args:
+            fraction: Completed fraction (0-1) / Tamamlanan oran (0-1)
+            bytes_done: Bytes transferred so far / Şimdiye kadar aktarılan bayt
+            start_time: Transfer start time / Transfer başlangıç zamanı
+        """
+        # A single assignment, no UI work on the transfer thread / Tek atama, transfer thread'inde UI işi yok
+        self._progress_state = (fraction, bytes_done, start_time)
+    
+    @contextmanager
+    def _progress_reporter(self):
+        """
+        Push recorded progress to callbacks from a background thread / Kaydedilen ilerlemeyi arka plan thread'inden geri çağırma fonksiyonlarına gönder
+        
+        Usage / Kullanım:
+            with self._progress_reporter():
+                ...  # calls self._report_progress(...)
+        """
+        self._progress_state = None
+        stop = threading.Event()
+        
+        def run():
+            last_state = None
+            while not stop.wait(self.PROGRESS_INTERVAL):
+                state = self._progress_state
+                if state is not None and state is not last_state:
+                    self._emit_progress(*state)
+                    last_state = state
+        
+        reporter = threading.Thread(target=run, daemon=True)
+        reporter.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            reporter.join()
+            
+            # Always deliver the final state / Son durumu her zaman ilet
+            state = self._progress_state
+            if state is not None:
+                self._emit_progress(*state)
+    
+    def _emit_progress(self, fraction: float, bytes_done: int, start_time: float):
+        """
+        Push progress, speed and ETA to callbacks / İlerleme, hız ve ETA'yı geri çağırma fonksiyonlarına gönder
+        
+        Args:
+            fraction: Completed fraction (0-1) / Tamamlanan oran (0-1)
+            bytes_done: Bytes transferred so far / Şimdiye kadar aktarılan bayt
+            start_time: Transfer start time / Transfer başlangıç zamanı
+        """
+        try:
+            if self.progress_callback:
+                self.progress_callback(fraction * 100)
+            
+            # Calculate speed and ETA / Hız ve ETA hesapla
+            elapsed = time.monotonic() - start_time
+            if elapsed > 0:
+                speed = bytes_done / elapsed
+                speed_str = self.format_size(speed) + "/s"
+                
+                if self.speed_callback:
+                    self.speed_callback(speed_str)
+                
+                if self.eta_callback:
+                    eta = elapsed * (1 - fraction) / fraction if fraction > 0 else 0
+                    eta_str = f"ETA: {self.format_time(eta)}"
+                    self.eta_callback(eta_str)
+        except Exception as e:
+            logger.debug("Progress callback error / İlerleme geri çağırma hatası: %s", e)
+    
+    def _get_sftp_client(self):
+        """
+        Get SFTP client if connected / Bağlıysa SFTP istemciyi al
+        
+        Returns:
+            SFTP client or None / SFTP istemci veya None
+        """
+        if not self.connection_manager.is_connected_to_server():
+            return None
+        return self.connection_manager.get_sftp_client()
+    
+    def _open_worker_channels(self, sftp_client, count: int) -> list:
+        """
+        Open SFTP channels for parallel workers / Paralel işçiler için SFTP kanalları aç
+        
+        The given client is always the first channel. The rest are spread
+        round-robin over the parallel SSH connections. Fewer channels are
+        returned if the server refuses to open more.
+        Verilen istemci her zaman ilk kanaldır. Diğerleri paralel SSH
+        bağlantılarına sırayla dağıtılır. Sunucu daha fazlasını açmayı
+        reddederse daha az kanal döner.
+        
+        Args:
+            sftp_client: Existing SFTP client / Mevcut SFTP istemci
+            count: Desired number of channels / İstenen kanal sayısı
+            
+        Returns:
+            List of SFTP clients / SFTP istemcilerinin listesi
+        """
+        channels = [sftp_client]
+        transports = self.connection_manager.get_parallel_transports() if count > 1 else []
+        while len(channels) < count:
+            # The main transport is first and already carries the given client / Ana transport ilk sıradadır ve verilen istemciyi zaten taşır
+            transport = transports[len(channels) % len(transports)] if transports else None
+            try:
+                channel = self.connection_manager.open_sftp_channel(transport)
+            except Exception as e:
+                logger.warning("SFTP channel error / SFTP kanal hatası: %s", e)
+                break
+            if channel is None:
+                break
+            channels.append(channel)
+        return channels
+    
+    def _copy_stream(self, reader, writer, callback: Optional[Callable] = None) -> int:
+        """
+        Copy data between file objects in large blocks / Dosya nesneleri arasında büyük bloklarla veri kopyala
+        
+        Args:
+            reader: Source file object / Kaynak dosya nesnesi
+            writer: Destination file object / Hedef dosya nesnesi
+            callback: Called with total bytes copied so far / Şimdiye kadar kopyalanan toplam bayt ile çağrılır
+            
+        Returns:
+            Number of bytes copied / Kopyalanan bayt sayısı
+        """
+        transferred = 0
+        
+        # Local files fill one reused buffer / Yerel dosyalar tek bir yeniden kullanılan tamponu doldurur
+        if isinstance(reader, io.BufferedIOBase):
+            view = memoryview(bytearray(self.block_size))
+            while True:
+                count = reader.readinto(view)
+                if not count:
+                    break
+                writer.write(view[:count])
+                transferred += count
+                if callback:
+                    callback(transferred)
+            return transferred
+        
+        # SFTP files already return fresh bytes per read / SFTP dosyaları her okumada zaten yeni bayt döndürür
+        while True:
+            data = reader.read(self.block_size)
+            if not data:
+                break
+            writer.write(data)
+            transferred += len(data)
+            if callback:
+                callback(transferred)
+        return transferred
+    
+    def _advise_sequential(self, local_file, offset: int = 0, length: int = 0):
+        """
+        Hint the kernel to read ahead aggressively / Çekirdeğe agresif önden okuma ipucu ver
+        
+        Args:
+            local_file: Open local file object / Açık yerel dosya nesnesi
+            offset: Start of the region / Bölgenin başlangıcı
+            length: Region length, 0 for the rest of the file / Bölge uzunluğu, dosyanın geri kalanı için 0
+        """
+        # Linux only, other platforms keep the default / Yalnızca Linux, diğer platformlar varsayılanı korur
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            os.posix_fadvise(local_file.fileno(), offset, length, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    
     def upload_directory(self, local_path: str, remote_path: str) -> bool:
         """
         Upload directory recursively / Klasörü özyinelemeli yükle
@@ -218,34 +670,32 @@ class FileTransfer:
         Returns:
             True if successful / Başarılı ise True
         """
-        if not self.connection_manager.is_connected_to_server():
-            return False
-        
-        sftp_client = self.connection_manager.get_sftp_client()
+        sftp_client = self._get_sftp_client()
         if not sftp_client:
             return False
+        return self._upload_directory(sftp_client, local_path, remote_path)
+    
+    def _upload_directory(self, sftp_client, local_path: str, remote_path: str) -> bool:
+        """
+        Upload directory recursively over the given SFTP client / Verilen SFTP istemci ile klasörü özyinelemeli yükle
         
-        try:
-            # Create remote directory / Uzak klasörü oluştur
-            try:
-                sftp_client.mkdir(remote_path)
-            except:
-                pass  # Directory already exists / Klasör zaten var
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            local_path: Local directory path / Yerel klasör yolu
+            remote_path: Remote directory path / Uzak klasör yolu
             
+        Returns:
+            True if successful / Başarılı ise True
+        """
+        try:
             # Upload files and subdirectories / Dosyaları ve alt klasörleri yükle
-            for item in os.listdir(local_path):
-                local_item_path = os.path.join(local_path, item)
-                remote_item_path = os.path.join(remote_path, item).replace("\\", "/")
-                
-                if os.path.isdir(local_item_path):
-                    self.upload_directory(local_item_path, remote_item_path)
-                else:
-                    self.upload_file(local_item_path, remote_item_path)
+            for local_item_path, remote_item_path, size in self._collect_upload_files(sftp_client, local_path, remote_path):
+                self._upload_file(sftp_client, local_item_path, remote_item_path, file_size=size)
             
             return True
             
         except Exception as e:
-            print(f"Directory upload error / Klasör yükleme hatası: {e}")
+            logger.error("Directory upload error / Klasör yükleme hatası: %s", e)
             return False
     
     def download_directory(self, remote_path: str, local_path: str) -> bool:
@@ -259,120 +709,554 @@ class FileTransfer:
         Returns:
             True if successful / Başarılı ise True
         """
-        if not self.connection_manager.is_connected_to_server():
-            return False
-        
-        sftp_client = self.connection_manager.get_sftp_client()
+        sftp_client = self._get_sftp_client()
         if not sftp_client:
             return False
+        return self._download_directory(sftp_client, remote_path, local_path)
+    
+    def _download_directory(self, sftp_client, remote_path: str, local_path: str) -> bool:
+        """
+        Download directory recursively over the given SFTP client / Verilen SFTP istemci ile klasörü özyinelemeli indir
         
-        try:
-            # Create local directory / Yerel klasörü oluştur
-            os.makedirs(local_path, exist_ok=True)
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            remote_path: Remote directory path / Uzak klasör yolu
+            local_path: Local directory path / Yerel klasör yolu
             
+        Returns:
+            True if successful / Başarılı ise True
+        """
+        try:
             # Download files and subdirectories / Dosyaları ve alt klasörleri indir
-            for item in sftp_client.listdir_attr(remote_path):
-                remote_item_path = os.path.join(remote_path, item.filename).replace("\\", "/")
-                local_item_path = os.path.join(local_path, item.filename)
-                
-                if self.is_directory(item.st_mode):
-                    self.download_directory(remote_item_path, local_item_path)
-                else:
-                    self.download_file(remote_item_path, local_item_path)
+            for remote_item_path, local_item_path, size in self._collect_download_files(sftp_client, remote_path, local_path):
+                self._download_file(sftp_client, remote_item_path, local_item_path, file_size=size)
             
             return True
             
         except Exception as e:
-            print(f"Directory download error / Klasör indirme hatası: {e}")
+            logger.error("Directory download error / Klasör indirme hatası: %s", e)
+            return False
+    
+    def _collect_upload_files(self, sftp_client, local_path: str, remote_path: str) -> List[Tuple[str, str, int]]:
+        """
+        Create remote folder tree and list files to upload / Uzak klasör ağacını oluştur ve yüklenecek dosyaları listele
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            local_path: Local directory path / Yerel klasör yolu
+            remote_path: Remote directory path / Uzak klasör yolu
+            
+        Returns:
+            List of (local, remote, size) file tuples / (yerel, uzak, boyut) dosya demetlerinin listesi
+        """
+        files = []
+        pending = [(local_path, remote_path)]
+        while pending:
+            local_dir, remote_dir = pending.pop()
+            
+            # Create remote directory / Uzak klasörü oluştur
+            try:
+                sftp_client.mkdir(remote_dir)
+            except:
+                pass  # Directory already exists / Klasör zaten var
+            
+            # DirEntry caches the type from the directory read / DirEntry türü dizin okumasından önbelleğe alır
+            # Remote paths always use '/' / Uzak yollar her zaman '/' kullanır
+            remote_prefix = remote_dir.rstrip("/") + "/"
+            with os.scandir(local_dir) as entries:
+                for entry in entries:
+                    remote_item_path = remote_prefix + entry.name
+                    if entry.is_dir():
+                        pending.append((entry.path, remote_item_path))
+                    else:
+                        files.append((entry.path, remote_item_path, entry.stat().st_size))
+        return files
+    
+    def _collect_download_files(self, sftp_client, remote_path: str, local_path: str) -> List[Tuple[str, str, int]]:
+        """
+        Create local folder tree and list files to download / Yerel klasör ağacını oluştur ve indirilecek dosyaları listele
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            remote_path: Remote directory path / Uzak klasör yolu
+            local_path: Local directory path / Yerel klasör yolu
+            
+        Returns:
+            List of (remote, local, size) file tuples / (uzak, yerel, boyut) dosya demetlerinin listesi
+        """
+        files = []
+        pending = [(remote_path, local_path)]
+        while pending:
+            remote_dir, local_dir = pending.pop()
+            
+            # Create local directory / Yerel klasörü oluştur
+            os.makedirs(local_dir, exist_ok=True)
+            
+            remote_prefix = remote_dir.rstrip("/") + "/"
+            for item in sftp_client.listdir_attr(remote_dir):
+                remote_item_path = remote_prefix + item.filename
+                local_item_path = os.path.join(local_dir, item.filename)
+                if item.st_mode is not None and S_ISDIR(item.st_mode):
+                    pending.append((remote_item_path, local_item_path))
+                else:
+                    files.append((remote_item_path, local_item_path, item.st_size))
+        return files
+    
+    def _expand_transfer_list(self, sftp_client, file_list: List[Tuple[str, str]],
+                              direction: str) -> Tuple[List[Tuple[str, str, int]], int]:
+        """
+        Expand selected folders into a flat list of files / Seçilen klasörleri düz dosya listesine aç
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            file_list: List of (source, destination) tuples / (kaynak, hedef) demetlerinin listesi
+            direction: 'upload' or 'download' / 'yükle' veya 'indir'
+            
+        Returns:
+            (source, destination, size) file tuples and the number of items that could not be scanned
+            (kaynak, hedef, boyut) dosya demetleri ve taranamayan öğe sayısı
+        """
+        jobs = []
+        failed = 0
+        for source, destination in file_list:
+            try:
+                if direction == "upload":
+                    if os.path.isdir(source):
+                        jobs.extend(self._collect_upload_files(sftp_client, source, destination))
+                    else:
+                        jobs.append((source, destination, os.path.getsize(source)))
+                else:  # download
+                    attributes = sftp_client.stat(source)
+                    if S_ISDIR(attributes.st_mode):
+                        jobs.extend(self._collect_download_files(sftp_client, source, destination))
+                    else:
+                        jobs.append((source, destination, attributes.st_size))
+            except Exception as e:
+                logger.error("Folder scan error / Klasör tarama hatası: %s", e)
+                failed += 1
+        return jobs, failed
+    
+    def _should_stream_tar(self, jobs: List[Tuple[str, str, int]]) -> bool:
+        """
+        Decide whether a batch is many small files / İşlemin çok sayıda küçük dosya olup olmadığına karar ver
+        
+        Args:
+            jobs: List of (source, destination, size) tuples / (kaynak, hedef, boyut) demetlerinin listesi
+            
+        Returns:
+            True if a tar stream should be tried / Tar akışı denenmeli ise True
+        """
+        if len(jobs) < self.TAR_MIN_FILES:
             return False
+        sizes = sorted(size or 0 for _, _, size in jobs)
+        return sizes[len(sizes) // 2] < self.TAR_MAX_MEDIAN_SIZE
+    
+    def _transfer_tar(self, sftp_client, jobs: List[Tuple[str, str, int]], direction: str,
+                      on_file_done: Callable) -> Optional[set]:
+        """
+        Move a batch through a single tar stream over SSH / İşlemi SSH üzerinden tek tar akışıyla taşı
+        
+        Saves one SFTP open/close round trip per file. Needs tar on the
+        remote side; on any failure the caller sends the rest over SFTP.
+        Files end up with the same modes and fresh mtimes an SFTP transfer
+        would give them.
+        Dosya başına bir SFTP aç/kapat gidiş dönüşünü önler. Uzak tarafta
+        tar gerektirir; herhangi bir hatada çağıran kalanı SFTP ile gönderir.
+        Dosyalar bir SFTP transferinin vereceği izinleri ve yeni
+        değişiklik zamanlarını alır.
+        
+        Args:
+            sftp_client: SFTP client to check a failed upload with / Başarısız yüklemeyi kontrol edecek SFTP istemci
+            jobs: List of (source, destination, size) tuples / (kaynak, hedef, boyut) demetlerinin listesi
+            direction: 'upload' or 'download' / 'yükle' veya 'indir'
+            on_file_done: Called with (index, size, duration) per file / Dosya başına (sıra, boyut, süre) ile çağrılır
+            
+        Returns:
+            None if finished or cancelled, else indexes delivered before the failure
+            Bittiyse veya iptal edildiyse None, değilse hatadan önce teslim edilen sıralar
+        """
+        ssh_client = self.connection_manager.get_ssh_client()
+        if not ssh_client:
+            return set()
+        
+        finished = set()
+        remote_start: List[int] = []
+        
+        def file_done(index, size, duration):
+            finished.add(index)
+            on_file_done(index, size, duration)
+        
+        try:
+            # Remote paths are relative to their common folder / Uzak yollar ortak klasörlerine göre görelidir
+            remote_paths = [destination if direction == "upload" else source for source, destination, _ in jobs]
+            base = posixpath.commonpath([posixpath.dirname(path) for path in remote_paths]) or "/"
+            names = [posixpath.relpath(path, base) for path in remote_paths]
+            
+            if direction == "upload":
+                self._upload_tar(ssh_client, jobs, base, names, file_done, remote_start.append)
+            else:
+                self._download_tar(ssh_client, jobs, base, names, file_done)
+            return None
+        except Exception as e:
+            if self._cancel_event.is_set():
+                return None
+            logger.warning("Tar stream failed, using SFTP / Tar akışı başarısız, SFTP kullanılıyor: %s", e)
+            return self._tar_delivered(sftp_client, jobs, direction, finished,
+                                       remote_start[0] if remote_start else None)
+    
+    def _tar_delivered(self, sftp_client, jobs: List[Tuple[str, str, int]], direction: str,
+                       finished: set, remote_start: Optional[int]) -> set:
+        """
+        Find files a failed tar stream already delivered / Başarısız tar akışının zaten teslim ettiği dosyaları bul
+        
+        Downloads are renamed into place only when complete. An upload
+        member may still sit unread in the channel when the remote tar
+        dies, so it only counts if the remote file has its size and was
+        written after the stream started; a stale copy is sent again.
+        İndirmeler yalnızca tamamlandığında yerine taşınır. Uzak tar
+        öldüğünde bir yükleme üyesi kanalda okunmadan bekliyor olabilir;
+        bu yüzden yalnızca uzak dosya boyutuna sahipse ve akış
+        başladıktan sonra yazıldıysa sayılır, eski bir kopya yeniden gönderilir.
+        
+        Args:
+            sftp_client: SFTP client to use / Kullanılacak SFTP istemci
+            jobs: List of (source, destination, size) tuples / (kaynak, hedef, boyut) demetlerinin listesi
+            direction: 'upload' or 'download' / 'yükle' veya 'indir'
+            finished: Indexes the stream reported done / Akışın bitti dediği sıralar
+            remote_start: Remote clock when tar started, None if unknown / Tar başladığında uzak saat, bilinmiyorsa None
+            
+        Returns:
+            Indexes that need no resend / Yeniden gönderilmesi gerekmeyen sıralar
+        """
+        if direction != "upload":
+            return set(finished)
+        if remote_start is None:
+            return set()
+        
+        by_folder = {}
+        for index in finished:
+            destination = jobs[index][1]
+            by_folder.setdefault(posixpath.dirname(destination), []).append(index)
+        
+        delivered = set()
+        for folder, indexes in by_folder.items():
+            try:
+                written = {item.filename: (item.st_size, item.st_mtime) for item in sftp_client.listdir_attr(folder)
+                           if item.st_mtime is not None and item.st_mtime >= remote_start}
+            except Exception:
+                continue  # Resend the whole folder / Tüm klasörü yeniden gönder
+            for index in indexes:
+                _, destination, size = jobs[index]
+                attributes = written.get(posixpath.basename(destination))
+                if attributes is not None and attributes[0] == size:
+                    delivered.add(index)
+        return delivered
+    
+    def _upload_tar(self, ssh_client, jobs: List[Tuple[str, str, int]], base: str,
+                    names: List[str], on_file_done: Callable, on_start: Callable):
+        """
+        Pack local files into remote 'tar x' / Yerel dosyaları uzak 'tar x' içine paketle
+        
+        Like an SFTP upload, files get the remote umask and the time they
+        were written: members carry mode 0666, and tar is told to apply the
+        umask (--no-same-permissions), skip the archived mtimes (-m) and
+        owners (-o).
+        SFTP yüklemesi gibi dosyalar uzak umask'ı ve yazıldıkları zamanı
+        alır: üyeler 0666 izniyle gider, tar'a umask'ı uygulaması
+        (--no-same-permissions), arşivdeki zamanları (-m) ve sahipleri (-o)
+        atlaması söylenir.
+        
+        Args:
+            ssh_client: Connected SSH client / Bağlı SSH istemci
+            jobs: List of (local, remote, size) tuples / (yerel, uzak, boyut) demetlerinin listesi
+            base: Remote folder names are relative to / İsimlerin göreli olduğu uzak klasör
+            names: Member name per job / İş başına üye adı
+            on_file_done: Called with (index, size, duration) per file / Dosya başına (sıra, boyut, süre) ile çağrılır
+            on_start: Called with the remote clock in seconds before extraction / Açmadan önce saniye cinsinden uzak saat ile çağrılır
+        """
+        stdin, stdout, stderr = ssh_client.exec_command(
+            "date +%s; tar xmof - --no-same-permissions -C " + shlex.quote(base))
+        
+        def as_sftp_would(info):
+            info.mode = 0o666
+            return info
+        
+        try:
+            on_start(int(stdout.readline()))
+            
+            # Follow links like an SFTP upload would / SFTP yüklemesi gibi bağlantıları izle
+            with tarfile.open(fileobj=stdin, mode="w|", bufsize=self.block_size, dereference=True) as tar:
+                for index, ((source, _, size), name) in enumerate(zip(jobs, names)):
+                    if self._cancel_event.is_set():
+                        raise Exception("Transfer cancelled / Transfer iptal edildi")
+                    start_time = time.monotonic()
+                    tar.add(source, arcname=name, recursive=False, filter=as_sftp_would)
+                    on_file_done(index, size, time.monotonic() - start_time)
+            stdin.close()
+            
+            status = stdout.channel.recv_exit_status()
+            if status != 0:
+                raise Exception(f"remote tar exited with {status}: {stderr.read().decode(errors='replace').strip()}")
+        finally:
+            stdout.channel.close()
+    
+    def _download_tar(self, ssh_client, jobs: List[Tuple[str, str, int]], base: str,
+                      names: List[str], on_file_done: Callable):
+        """
+        Unpack remote 'tar c' output into local files / Uzak 'tar c' çıktısını yerel dosyalara aç
+        
+        Member data is written to new files, so like an SFTP download they
+        get the local umask and the current time.
+        Üye verisi yeni dosyalara yazılır; böylece SFTP indirmesi gibi yerel
+        umask'ı ve şimdiki zamanı alırlar.
+        
+        Args:
+            ssh_client: Connected SSH client / Bağlı SSH istemci
+            jobs: List of (remote, local, size) tuples / (uzak, yerel, boyut) demetlerinin listesi
+            base: Remote folder names are relative to / İsimlerin göreli olduğu uzak klasör
+            names: Member name per job / İş başına üye adı
+            on_file_done: Called with (index, size, duration) per file / Dosya başına (sıra, boyut, süre) ile çağrılır
+        """
+        stdin, stdout, stderr = ssh_client.exec_command("tar cf - -h -C " + shlex.quote(base) + " --null -T -")
+        
+        # Only members we asked for are written, to their known paths / Yalnızca istenen üyeler bilinen yollarına yazılır
+        targets = {name: index for index, name in enumerate(names)}
+        
+        # Feed names from a side thread so a full output window can't stall us
+        # Dolu çıktı penceresi bizi durdurmasın diye isimleri yan thread'den gönder
+        def send_names():
+            try:
+                stdin.write("".join(name + "\0" for name in names).encode("utf-8"))
+            finally:
+                stdin.close()
+        
+        feeder = threading.Thread(target=send_names, daemon=True)
+        feeder.start()
+        try:
+            done = 0
+            with tarfile.open(fileobj=stdout, mode="r|", bufsize=self.block_size) as tar:
+                start_time = time.monotonic()
+                for member in tar:
+                    index = targets.get(member.name)
+                    if index is None or not member.isfile():
+                        continue
+                    if self._cancel_event.is_set():
+                        raise Exception("Transfer cancelled / Transfer iptal edildi")
+                    
+                    local_path = jobs[index][1]
+                    part_path = local_path + self.PARTIAL_SUFFIX
+                    try:
+                        with open(part_path, 'wb') as local_file:
+                            self._copy_stream(tar.extractfile(member), local_file)
+                    except Exception:
+                        self._remove_partial(part_path)
+                        raise
+                    os.replace(part_path, local_path)
+                    
+                    now = time.monotonic()
+                    on_file_done(index, member.size, now - start_time)
+                    start_time = now
+                    done += 1
+            
+            status = stdout.channel.recv_exit_status()
+            if status != 0 or done != len(jobs):
+                raise Exception(f"remote tar exited with {status} after {done}/{len(jobs)} files: "
+                                f"{stderr.read().decode(errors='replace').strip()}")
+        finally:
+            stdout.channel.close()
+            feeder.join()
     
-    def transfer_files(self, file_list: List[Tuple[str, str]], direction: str) -> bool:
+    def transfer_files(self, file_list: List[Tuple[str, str]], direction: str,
+                       on_complete: Optional[Callable] = None) -> bool:
         """
         Transfer multiple files / Birden fazla dosya transfer et
         
         Args:
             file_list: List of (source, destination) tuples / (kaynak, hedef) demetlerinin listesi
             direction: 'upload' or 'download' / 'yükle' veya 'indir'
+            on_complete: Called on the transfer thread when the batch ends / Toplu işlem bittiğinde transfer thread'inde çağrılır
             
         Returns:
             True if all transfers successful / Tüm transferler başarılı ise True
         """
-        if self.transfer_in_progress:
+        if self._active_event.is_set():
             return False
         
+        # Mark busy before the thread starts / Thread başlamadan önce meşgul olarak işaretle
+        self._active_event.set()
+        self._cancel_event.clear()
+        is_cancelled = self._cancel_event.is_set
+        
         def transfer_thread():
+            channels = []
             try:
-                self.transfer_in_progress = True
-                self.transfer_cancelled = False
+                # Reuse one SFTP session for the whole batch / Tüm işlem için tek SFTP oturumu kullan
+                sftp_client = self._get_sftp_client()
+                if not sftp_client:
+                    if self.status_callback:
+                        self.status_callback("Not connected")
+                    return
                 
-                total_files = len(file_list)
+                # Expand folders so the whole tree is spread over workers / Tüm ağacın işçilere dağılması için klasörleri aç
+                jobs, errors = self._expand_transfer_list(sftp_client, file_list, direction)
+                total_files = len(jobs)
                 
-                for i, (source, destination) in enumerate(file_list):
-                    if self.transfer_cancelled:
-                        break
-                    
+                def final_status():
+                    if is_cancelled():
+                        return "Transfer cancelled"
+                    if errors:
+                        return f"Transfer completed with {errors} {'error' if errors == 1 else 'errors'}"
+                    return "Transfer completed"
+                
+                # Aggregated progress across workers / İşçiler arası toplam ilerleme
+                lock = threading.Lock()
+                file_fractions = [0.0] * total_files
+                file_bytes = [0] * total_files
+                overall_fraction = 0.0
+                total_bytes = 0
+                started = 0
+                batch_start = time.monotonic()
+                
+                def update_progress(index, transferred, fraction):
+                    nonlocal overall_fraction, total_bytes
+                    with lock:
+                        overall_fraction += (fraction - file_fractions[index]) / total_files
+                        total_bytes += transferred - file_bytes[index]
+                        file_fractions[index] = fraction
+                        file_bytes[index] = transferred
+                        current_fraction, current_bytes = overall_fraction, total_bytes
+                    self._report_progress(current_fraction, current_bytes, batch_start)
+                
+                def tar_file_done(index, size, duration):
+                    source = jobs[index][0]
                     if self.status_callback:
-                        filename = os.path.basename(source)
-                        status = f"Transferring ({i+1}/{total_files}): {filename}"
-                        self.status_callback(status)
+                        self.status_callback(f"Transferring ({index + 1}/{total_files}): {os.path.basename(source)}")
+                    with lock:
+                        self.log_transfer(direction, os.path.basename(source), size, duration)
+                    update_progress(index, size, 1.0)
+                
+                # Many small files: one tar stream instead of an SFTP open per file
+                # Çok sayıda küçük dosya: dosya başına SFTP açmak yerine tek tar akışı
+                delivered = set()
+                if self._should_stream_tar(jobs):
+                    with self._progress_reporter():
+                        delivered = self._transfer_tar(sftp_client, jobs, direction, tar_file_done)
+                    if delivered is None:
+                        if self.status_callback:
+                            self.status_callback(final_status())
+                        return
+                
+                # Only files the tar stream did not deliver go over SFTP / Yalnızca tar akışının teslim etmediği dosyalar SFTP ile gider
+                pending = [index for index in range(total_files) if index not in delivered]
+                started = len(delivered)
+                
+                # One batch-wide channel budget; large files get spare channels for ranges
+                # Tek bir işlem geneli kanal bütçesi; büyük dosyalar aralıklar için artan kanalları alır
+                budget = self.CHANNELS_PER_CONNECTION * max(1, len(self.connection_manager.get_parallel_transports()))
+                workers = max(1, min(self.max_parallel_transfers, len(pending), budget))
+                per_file = 1
+                if any(jobs[index][2] >= self.LARGE_FILE_THRESHOLD for index in pending):
+                    per_file = max(1, min(self.CHUNK_WORKERS, budget // workers))
+                channels = self._open_worker_channels(sftp_client, workers * per_file)
+                
+                # Each worker takes a set of channels, the first one for small files
+                # Her işçi bir kanal kümesi alır, küçük dosyalar için ilki kullanılır
+                workers = min(workers, len(channels))
+                channel_pool = queue.Queue()
+                for position in range(workers):
+                    channel_pool.put(channels[position::workers])
+                
+                def transfer_one(index, source, destination, size):
+                    nonlocal started, errors
+                    if is_cancelled():
+                        return
                     
-                    start_time = time.time()
+                    channel_set = channel_pool.get()
+                    channel, range_channels = channel_set[0], channel_set[1:]
                     success = False
-                    
                     try:
+                        with lock:
+                            started += 1
+                            position = started
+                        
+                        if self.status_callback:
+                            filename = os.path.basename(source)
+                            status = f"Transferring ({position}/{total_files}): {filename}"
+                            self.status_callback(status)
+                        
+                        def on_progress(transferred, file_size):
+                            update_progress(index, transferred, transferred / file_size if file_size else 1.0)
+                        
+                        start_time = time.monotonic()
                         if direction == "upload":
-                            if os.path.isdir(source):
-                                success = self.upload_directory(source, destination)
-                            else:
-                                success = self.upload_file(source, destination)
+                            success = self._upload_file(channel, source, destination, on_progress, size, range_channels)
                         else:  # download
-                            success = self.download_file(source, destination)
+                            success = self._download_file(channel, source, destination, on_progress, size, range_channels)
                         
-                        if success and not self.transfer_cancelled:
+                        if success and not is_cancelled():
                             # Log transfer / Transferi kaydet
-                            duration = time.time() - start_time
-                            file_size = self.get_file_size(source, direction == "download")
-                            self.log_transfer(direction, os.path.basename(source), file_size, duration)
+                            duration = time.monotonic() - start_time
+                            with lock:
+                                self.log_transfer(direction, os.path.basename(source), size, duration)
                     
                     except Exception as e:
-                        print(f"File transfer error / Dosya transfer hatası: {e}")
+                        logger.error("File transfer error / Dosya transfer hatası: %s", e)
                     
-                    # Update progress / İlerleme güncelle
-                    if not self.transfer_cancelled:
-                        progress = ((i + 1) / total_files) * 100
-                        if self.progress_callback:
-                            self.progress_callback(progress)
+                    finally:
+                        channel_pool.put(channel_set)
+                        
+                        if not success and not is_cancelled():
+                            with lock:
+                                errors += 1
+                        
+                        # Count the file as done / Dosyayı tamamlanmış say
+                        if not is_cancelled():
+                            update_progress(index, file_bytes[index], 1.0)
+                
+                with self._progress_reporter(), ThreadPoolExecutor(max_workers=workers) as executor:
+                    for index in pending:
+                        executor.submit(transfer_one, index, *jobs[index])
                 
                 if self.status_callback:
-                    if self.transfer_cancelled:
-                        self.status_callback("Transfer cancelled")
-                    else:
-                        self.status_callback("Transfer completed")
+                    self.status_callback(final_status())
                 
             except Exception as e:
-                print(f"Transfer thread error / Transfer thread hatası: {e}")
+                logger.error("Transfer thread error / Transfer thread hatası: %s", e)
             finally:
-                self.transfer_in_progress = False
-                self.transfer_cancelled = False
+                # Close extra worker channels / Ek işçi kanallarını kapat
+                for channel in channels[1:]:
+                    try:
+                        channel.close()
+                    except Exception:
+                        pass
+                self._cancel_event.clear()
+                self._active_event.clear()
+                
+                if on_complete:
+                    try:
+                        on_complete()
+                    except Exception as e:
+                        logger.error("Completion callback error / Tamamlanma geri çağırma hatası: %s", e)
         
         self.current_transfer_thread = threading.Thread(target=transfer_thread, daemon=True)
         self.current_transfer_thread.start()
         return True
     
-    def get_file_size(self, path: str, is_remote: bool = False) -> Optional[int]:
+    def get_file_size(self, path: str, is_remote: bool = False, sftp_client=None) -> Optional[int]:
         """
         Get file size / Dosya boyutunu al
         
         Args:
             path: File path / Dosya yolu
             is_remote: True if remote file / Uzak dosya ise True
+            sftp_client: SFTP client to reuse / Yeniden kullanılacak SFTP istemci
             
         Returns:
             File size in bytes or None / Bayt cinsinden dosya boyutu veya None
         """
         try:
             if is_remote:
-                sftp_client = self.connection_manager.get_sftp_client()
+                sftp_client = sftp_client or self.connection_manager.get_sftp_client()
                 if sftp_client:
                     return sftp_client.stat(path).st_size
             else:
@@ -390,7 +1274,7 @@ class FileTransfer:
         Returns:
             True if directory / Klasör ise True
         """
-        return (mode & 0o040000) != 0
+        return S_ISDIR(mode)
     
     def format_size(self, size: float) -> str:
         """
@@ -402,16 +1286,12 @@ class FileTransfer:
         Returns:
             Formatted size string / Formatlanmış boyut dizisi
         """
-        if size == 0:
-            return "0 B"
-        elif size < 1024:
+        # Every 10 bits is one unit step / Her 10 bit bir birim adımıdır
+        index = min((int(size).bit_length() - 1) // 10, len(self._SIZE_UNITS) - 1)
+        if index <= 0:
             return f"{size} B"
-        elif size < 1024**2:
-            return f"{size/1024:.1f} KB"
-        elif size < 1024**3:
-            return f"{size/(1024**2):.1f} MB"
-        else:
-            return f"{size/(1024**3):.1f} GB"
+        unit, divisor = self._SIZE_UNITS[index]
+        return f"{size/divisor:.1f} {unit}"
     
     def format_time(self, seconds: float) -> str:
         """
@@ -440,7 +1320,7 @@ class FileTransfer:
             size: File size / Dosya boyutu
             duration: Transfer duration / Transfer süresi
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         log_entry = {
             "timestamp": timestamp,
             "action": action,
@@ -448,11 +1328,8 @@ class FileTransfer:
             "size": size,
             "duration": duration
         }
+        # Oldest entry drops off automatically / En eski kayıt otomatik olarak düşer
         self.transfer_log.append(log_entry)
-        
-        # Keep only last 100 entries / Sadece son 100 kaydı tut
-        if len(self.transfer_log) > 100:
-            self.transfer_log = self.transfer_log[-100:]
     
     def get_transfer_log(self) -> List[dict]:
         """
@@ -461,7 +1338,22 @@ class FileTransfer:
         Returns:
             List of transfer log entries / Transfer günlük kayıtlarının listesi
         """
-        return self.transfer_log.copy()
+        return list(self.transfer_log)
+    
+    def get_recent_transfers(self, count: int) -> List[dict]:
+        """
+        Get the newest transfer log entries / En yeni transfer günlük kayıtlarını al
+        
+        Args:
+            count: Maximum number of entries / En fazla kayıt sayısı
+            
+        Returns:
+            Up to count entries, oldest first / En eskisi başta olmak üzere en fazla count kayıt
+        """
+        # Walk from the newest end, no copy of the whole log / En yeni uçtan yürü, tüm günlüğü kopyalamadan
+        entries = list(itertools.islice(reversed(self.transfer_log), max(0, count)))
+        entries.reverse()
+        return entries
     
     def clear_transfer_log(self):
         """Clear transfer log / Transfer günlüğünü temizle"""
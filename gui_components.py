@@ -13,13 +13,49 @@ License / Lisans: MIT
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import os
+import posixpath
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from stat import S_ISDIR
 from typing import Optional, Callable, List, Dict, Any
-from datetime import datetime
 
 
 class FileTransferGUI:
     """Main GUI class for file transfer application / Dosya transfer uygulaması için ana GUI sınıfı"""
     
+    # Rows inserted per idle step when filling a file tree / Dosya ağacı doldurulurken boşta adım başına eklenen satır
+    TREE_BATCH_SIZE = 500
+    
+    # Remote listing cache / Uzak listeleme önbelleği
+    REMOTE_CACHE_TTL = 5.0  # seconds / saniye
+    REMOTE_CACHE_SIZE = 64
+    
+    # Listing rows are (rank, sort name, name, size, modified); folders rank 0
+    # Listeleme satırları (sıra, sıralama adı, ad, boyut, değiştirilme); klasörlerin sırası 0
+    _SORT_KEY = itemgetter(0, 1)
+    
+    # Formatted modification times kept per minute / Dakika başına tutulan biçimlenmiş değiştirilme zamanları
+    MTIME_CACHE_SIZE = 4096
+    
+    # Quiet time before a keyboard refresh runs / Klavye yenilemesi çalışmadan önceki sessiz süre
+    REFRESH_DEBOUNCE_MS = 150
+    
+    # Worker threads for blocking local and connection work / Engelleyen yerel ve bağlantı işleri için iş parçacıkları
+    IO_WORKERS = 4
+    
+    # Child folders listed ahead after showing a remote folder / Uzak klasör gösterildikten sonra önceden listelenen alt klasörler
+    PREFETCH_LIMIT = 4
+    
+    # SFTP channels removing files of a remote folder in parallel; with the transfer, browsing and
+    # prefetch channels this stays within OpenSSH's default 10 sessions per connection
+    # Uzak klasörün dosyalarını paralel silen SFTP kanalları; transfer, gezinme ve önden yükleme
+    # kanallarıyla birlikte OpenSSH'in bağlantı başına varsayılan 10 oturum sınırında kalır
+    DELETE_CHANNELS = 4
+    
     def __init__(self, root, config_manager, connection_manager, file_transfer):
         """
         Initialize GUI / GUI'yi başlat
@@ -45,6 +81,48 @@ class FileTransferGUI:
         # GUI variables / GUI değişkenleri
         self.progress_var = tk.DoubleVar()
         
+        # Pending tree fills: tree name -> (after id, rows, next index) / Bekleyen ağaç dolumları: ağaç adı -> (after id, satırlar, sonraki indeks)
+        self._fill_jobs: Dict[str, tuple] = {}
+        
+        # Row details: tree name -> {item id: (name, is_dir)} / Satır bilgileri: ağaç adı -> {öğe kimliği: (ad, klasör mü)}
+        self._tree_rows: Dict[str, Dict[str, tuple]] = {}
+        
+        # Background remote listing state / Arka plan uzak listeleme durumu
+        self._remote_refresh_inflight: Optional[str] = None
+        self._remote_refresh_seq = 0
+        self._remote_refresh_again = False
+        
+        # Recent remote listings: path -> (time, items) / Son uzak listelemeler: yol -> (zaman, öğeler)
+        self._remote_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        
+        # Bumped by every invalidation; older prefetch results are dropped / Her geçersiz kılmada artar; daha eski önden yükleme sonuçları atılır
+        self._cache_generation = 0
+        try:
+            self.REMOTE_CACHE_TTL = float(config_manager.get_setting("remote_cache_ttl", self.REMOTE_CACHE_TTL))
+        except (TypeError, ValueError):
+            pass  # Keep the default / Varsayılanı koru
+        
+        # Minute -> "YYYY-MM-DD HH:MM", shared with listing threads / Dakika -> "YYYY-AA-GG SS:DD", listeleme iş parçacıklarıyla paylaşılır
+        self._mtime_cache: Dict[int, str] = {}
+        self._mtime_lock = threading.Lock()
+        
+        # Pending keyboard refreshes: panel -> after id / Bekleyen klavye yenilemeleri: panel -> after kimliği
+        self._refresh_jobs: Dict[str, str] = {}
+        
+        # Shared pool for blocking local and connection calls / Engelleyen yerel ve bağlantı çağrıları için ortak havuz
+        self._io_executor = ThreadPoolExecutor(max_workers=self.IO_WORKERS)
+        
+        # An SFTP client is not safe to share between threads, so remote work runs one call at a time
+        # SFTP istemcisi thread'ler arasında paylaşılamaz, bu yüzden uzak işler tek tek çalışır
+        self._sftp_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Prefetches run one at a time so they never crowd out user actions
+        # Ön getirmeler kullanıcı işlemlerini engellememek için tek tek çalışır
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_futures: List[Any] = []
+        # Own SFTP channel, only touched by the prefetch thread / Yalnızca ön getirme thread'inin kullandığı kendi SFTP kanalı
+        self._prefetch_sftp = None
+        
         # Setup UI / Arayüzü ayarla
         self.setup_ui()
         
@@ -70,6 +148,7 @@ class FileTransferGUI:
         self._create_file_panels(main_frame)
         self._create_progress_frame(main_frame)
         self._create_control_frame(main_frame)
+        self._create_context_menus()
         
         # Keyboard shortcuts / Klavye kısayolları
         self._setup_keyboard_shortcuts()
@@ -168,12 +247,19 @@ class FileTransferGUI:
         file_frame.columnconfigure(0, weight=1)
         file_frame.columnconfigure(2, weight=1)
         file_frame.rowconfigure(1, weight=1)
+        self._file_frame = file_frame
         
         # Local panel
         self._create_local_panel(file_frame)
         
-        # Remote panel
-        self._create_remote_panel(file_frame)
+        # Remote panel is built on the first connect; its column stays reserved
+        # Uzak panel ilk bağlantıda oluşturulur; sütunu ayrılmış kalır
+        self.remote_tree = None
+    
+    def _ensure_remote_panel(self):
+        """Create the remote panel if it does not exist yet / Uzak panel yoksa oluştur"""
+        if self.remote_tree is None:
+            self._create_remote_panel(self._file_frame)
     
     def _create_local_panel(self, parent):
         """Create local file panel / Yerel dosya panelini oluştur"""
@@ -299,11 +385,45 @@ class FileTransferGUI:
         # Log button
         ttk.Button(log_frame, text="📋 Transfer Log", command=self.show_transfer_log).grid(row=0, column=0, padx=(0, 0))
     
+    def _create_context_menus(self):
+        """Create file panel context menus once / Dosya paneli bağlam menülerini bir kez oluştur"""
+        # Entries act on the row last right-clicked in that panel
+        self._local_ctx = ("", "", False)
+        self.local_context_menu = tk.Menu(self.root, tearoff=0)
+        self.local_context_menu.add_command(label="Transfer to Remote", command=self.transfer_to_remote)
+        self.local_context_menu.add_separator()
+        self.local_context_menu.add_command(label="Rename", command=lambda: self.rename_local_file(*self._local_ctx[1:]))
+        self.local_context_menu.add_command(label="Delete", command=lambda: self.delete_local_file(self._local_ctx[1]))
+        self.local_context_menu.add_separator()
+        self.local_context_menu.add_command(label="File Info", command=lambda: self._show_file_info(*self._local_ctx[:2]))
+        
+        self._remote_ctx = ("", "", False)
+        self.remote_context_menu = tk.Menu(self.root, tearoff=0)
+        self.remote_context_menu.add_command(label="Download to PC", command=self.transfer_to_local)
+        self.remote_context_menu.add_separator()
+        self.remote_context_menu.add_command(label="Rename", command=lambda: self.rename_remote_file(*self._remote_ctx[1:]))
+        self.remote_context_menu.add_command(label="Delete", command=lambda: self.delete_remote_file(*self._remote_ctx[1:]))
+        self.remote_context_menu.add_separator()
+        self.remote_context_menu.add_command(label="File Info", command=lambda: self._show_file_info(*self._remote_ctx[:2]))
+    
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts / Klavye kısayollarını ayarla"""
-        self.root.bind("<F5>", lambda e: self.refresh_local_files())
-        self.root.bind("<Control-r>", lambda e: self.refresh_remote_files())
-        self.root.bind("<Control-F5>", lambda e: self.refresh_remote_files())
+        # Held keys repeat, so only the last press in a burst refreshes
+        self.root.bind("<F5>", lambda e: self._schedule_refresh("local", self.refresh_local_files))
+        self.root.bind("<Control-r>", lambda e: self._schedule_refresh("remote", self.refresh_remote_files))
+        self.root.bind("<Control-F5>", lambda e: self._schedule_refresh("remote", self.refresh_remote_files))
+    
+    def _schedule_refresh(self, panel, refresh):
+        """Run a refresh once key presses for the panel stop"""
+        job = self._refresh_jobs.get(panel)
+        if job:
+            self.root.after_cancel(job)
+        self._refresh_jobs[panel] = self.root.after(self.REFRESH_DEBOUNCE_MS, self._run_refresh, panel, refresh)
+    
+    def _run_refresh(self, panel, refresh):
+        """Run a debounced refresh"""
+        self._refresh_jobs.pop(panel, None)
+        refresh()
     
     # Connection management methods / Bağlantı yönetim metodları
     def connect(self):
@@ -317,34 +437,28 @@ class FileTransferGUI:
             messagebox.showerror("Error", "Fill all fields!")
             return
         
-        try:
-            port = int(port)
-        except ValueError:
-            messagebox.showerror("Error", "Port must be a valid number!")
+        port = self._parse_port(port)
+        if port is None:
+            messagebox.showerror("Error", "Port must be a number between 1 and 65535!")
             return
         
-        # Connect in separate thread / Ayrı thread'de bağlan
-        def connect_thread():
-            try:
-                self.connect_btn.config(state="disabled")
-                self.status_label.config(text="Connecting...", foreground="orange")
-                self.root.update()
-                
-                success, error_msg = self.connection_manager.connect(ip, user, password, port)
-                
-                if success:
-                    # Save last connection / Son bağlantıyı kaydet
-                    connection_name = f"{user}@{ip}:{port}"
-                    self.config_manager.set_last_connection(connection_name)
-                    self.root.after(0, self.on_connection_success)
-                else:
-                    self.root.after(0, lambda: self.on_connection_error(error_msg))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.on_connection_error(str(e)))
+        self._ensure_remote_panel()
+        self._on_connect_starting()
         
-        import threading
-        threading.Thread(target=connect_thread, daemon=True).start()
+        # Connect in separate thread / Ayrı thread'de bağlan
+        self._run_in_background(self._connect_worker, ip, user, password, port)
+    
+    def _on_connect_starting(self):
+        """Show that a connection attempt is running"""
+        self.connect_btn.config(state="disabled")
+        self.status_label.config(text="Connecting...", foreground="orange")
+    
+    def _connect_worker(self, ip, user, password, port):
+        """Connect off the Tk thread; the manager's callbacks report the result"""
+        success, _ = self.connection_manager.connect(ip, user, password, port)
+        if success:
+            # Save last connection / Son bağlantıyı kaydet
+            self.root.after(0, self.config_manager.set_last_connection, self._connection_name(user, ip, port))
     
     def disconnect(self):
         """Close connection / Bağlantıyı kapat"""
@@ -366,14 +480,20 @@ class FileTransferGUI:
         self.status_label.config(text="Disconnected", foreground="red")
         self.connect_btn.config(state="normal")
         self.disconnect_btn.config(state="disabled")
-        self.remote_back_btn.config(state="disabled")
-        self.remote_up_btn.config(state="disabled")
         self.transfer_to_remote_btn.config(state="disabled")
         self.transfer_to_local_btn.config(state="disabled")
         
+        # Ignore listings still on the way / Yoldaki listelemeleri yok say
+        self._remote_refresh_seq += 1
+        self._remote_refresh_inflight = None
+        self._remote_cache.clear()
+        self._cancel_prefetch()
+        
         # Clear remote file list / Remote dosya listesini temizle
-        for item in self.remote_tree.get_children():
-            self.remote_tree.delete(item)
+        if self.remote_tree is not None:
+            self.remote_back_btn.config(state="disabled")
+            self.remote_up_btn.config(state="disabled")
+            self._populate_tree(self.remote_tree, [])
     
     def on_connection_error(self, error_msg):
         """Handle connection error / Bağlantı hatasını işle"""
@@ -409,14 +529,27 @@ class FileTransferGUI:
             messagebox.showerror("Error", "Fill IP, username and port fields!")
             return
         
-        try:
-            port = int(port)
-            name = f"{user}@{ip}:{port}"
-            self.config_manager.add_connection(name, ip, user, port)
-            self.update_connection_combo()
-            messagebox.showinfo("Success", "Connection saved!")
-        except ValueError:
-            messagebox.showerror("Error", "Port must be a valid number!")
+        port = self._parse_port(port)
+        if port is None:
+            messagebox.showerror("Error", "Port must be a number between 1 and 65535!")
+            return
+        
+        self.config_manager.add_connection(self._connection_name(user, ip, port), ip, user, port)
+        self.update_connection_combo()
+        messagebox.showinfo("Success", "Connection saved!")
+    
+    @staticmethod
+    def _parse_port(text: str) -> Optional[int]:
+        """Return the port number in text, or None if it is not a valid port"""
+        if not (text.isascii() and text.isdigit()):
+            return None
+        port = int(text)
+        return port if 0 < port < 65536 else None
+    
+    @staticmethod
+    def _connection_name(user: str, ip: str, port: int) -> str:
+        """Build the profile name used for a connection"""
+        return f"{user}@{ip}:{port}"
     
     def load_connection(self, event=None):
         """Load connection profile"""
@@ -426,13 +559,7 @@ class FileTransferGUI:
         
         connection = self.config_manager.get_connection(selected)
         if connection:
-            self.ip_entry.delete(0, tk.END)
-            self.ip_entry.insert(0, connection["ip"])
-            self.user_entry.delete(0, tk.END)
-            self.user_entry.insert(0, connection["user"])
-            self.port_entry.delete(0, tk.END)
-            self.port_entry.insert(0, str(connection["port"]))
-            self.password_entry.delete(0, tk.END)
+            self.fill_connection_fields(connection["ip"], connection["user"], connection["port"])
     
     def delete_connection(self):
         """Delete connection profile"""
@@ -448,15 +575,24 @@ class FileTransferGUI:
     
     def quick_connect(self, ip, user, port):
         """Quick connect with predefined settings"""
-        self.ip_entry.delete(0, tk.END)
-        self.ip_entry.insert(0, ip)
-        self.user_entry.delete(0, tk.END)
-        self.user_entry.insert(0, user)
-        self.port_entry.delete(0, tk.END)
-        self.port_entry.insert(0, port)
-        self.password_entry.delete(0, tk.END)
+        self.fill_connection_fields(ip, user, port)
         self.password_entry.focus()
     
+    def fill_connection_fields(self, ip, user, port):
+        """Show a connection in the entry fields and clear the password"""
+        self._set_entry(self.ip_entry, ip)
+        self._set_entry(self.user_entry, user)
+        self._set_entry(self.port_entry, str(port))
+        self._set_entry(self.password_entry, "")
+    
+    @staticmethod
+    def _set_entry(entry, value):
+        """Replace the text of an entry unless it already matches"""
+        if entry.get() == value:
+            return
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
+    
     def update_connection_combo(self):
         """Update connection combo box"""
         connections = self.config_manager.get_connection_names()
@@ -469,106 +605,282 @@ class FileTransferGUI:
     
     def refresh_local_files(self):
         """Refresh local file list"""
-        # Clear current items
-        for item in self.local_tree.get_children():
-            self.local_tree.delete(item)
-        
         try:
             # Add folders and files
             items = []
-            for item in os.listdir(self.local_current_path):
-                item_path = os.path.join(self.local_current_path, item)
-                if os.path.isdir(item_path):
-                    items.append((item, "Folder", "", True))
-                else:
-                    size = os.path.getsize(item_path)
-                    modified = datetime.fromtimestamp(os.path.getmtime(item_path))
-                    items.append((item, self.format_size(size), modified.strftime("%Y-%m-%d %H:%M"), False))
+            with os.scandir(self.local_current_path) as entries:
+                for entry in entries:
+                    # Skip entries that vanish or can't be read, e.g. broken links
+                    try:
+                        name = entry.name
+                        if entry.is_dir():
+                            items.append((0, name.lower(), name, "Folder", ""))
+                        else:
+                            st = entry.stat()
+                            items.append((1, name.lower(), name, self.format_size(st.st_size), self._format_mtime(st.st_mtime)))
+                    except OSError:
+                        continue
             
             # Sort (folders first, then files)
-            items.sort(key=lambda x: (not x[3], x[0].lower()))
+            items.sort(key=self._SORT_KEY)
             
-            for name, size, modified, is_dir in items:
-                icon = "📁" if is_dir else "📄"
-                item_id = self.local_tree.insert("", "end", text=f"{icon} {name}", values=(size, modified))
-                if is_dir:
-                    self.local_tree.set(item_id, "size", "Folder")
+            self._populate_tree(self.local_tree, items)
             
         except PermissionError:
+            self._populate_tree(self.local_tree, [])
             messagebox.showerror("Error", f"No permission to access '{self.local_current_path}'!")
         except Exception as e:
+            self._populate_tree(self.local_tree, [])
             messagebox.showerror("Error", f"Error loading local files: {e}")
         
         self.local_path_label.config(text=self.local_current_path)
     
     def format_size(self, size: float) -> str:
         """Format size in human readable format"""
-        if size == 0:
-            return "0 B"
-        elif size < 1024:
-            return f"{size} B"
-        elif size < 1024**2:
-            return f"{size/1024:.1f} KB"
-        elif size < 1024**3:
-            return f"{size/(1024**2):.1f} MB"
-        else:
-            return f"{size/(1024**3):.1f} GB"
+        return self.file_transfer.format_size(size)
     
-    def refresh_remote_files(self):
-        """Refresh remote file list"""
+    def _format_mtime(self, mtime: float) -> str:
+        """Format a modification time as YYYY-MM-DD HH:MM, cached per minute"""
+        minute = int(mtime // 60)
+        with self._mtime_lock:
+            formatted = self._mtime_cache.get(minute)
+            if formatted is None:
+                lt = time.localtime(minute * 60)
+                formatted = "%04d-%02d-%02d %02d:%02d" % (lt.tm_year, lt.tm_mon, lt.tm_mday, lt.tm_hour, lt.tm_min)
+                if len(self._mtime_cache) >= self.MTIME_CACHE_SIZE:
+                    # Dicts keep insertion order, so this drops the oldest
+                    del self._mtime_cache[next(iter(self._mtime_cache))]
+                self._mtime_cache[minute] = formatted
+        return formatted
+    
+    def refresh_remote_files(self, use_cache=False):
+        """Refresh remote file list, optionally from a recent listing"""
         if not self.connection_manager.is_connected_to_server():
             return
         
-        sftp_client = self.connection_manager.get_sftp_client()
-        if not sftp_client:
+        path = self.remote_current_path
+        self._cancel_prefetch()
+        
+        # Serve recently visited folders from memory
+        cached = self._get_cached_listing(path) if use_cache else None
+        if cached is not None:
+            self._remote_refresh_seq += 1
+            self._remote_refresh_inflight = None
+            self._populate_tree(self.remote_tree, cached)
+            self.remote_path_label.config(text=path)
+            self._prefetch_children(path, cached)
             return
         
-        # Clear current items
-        for item in self.remote_tree.get_children():
-            self.remote_tree.delete(item)
+        # Coalesce requests while this folder is already being listed
+        if self._remote_refresh_inflight == path:
+            self._remote_refresh_again = True
+            return
+        self._remote_refresh_inflight = path
+        self._remote_refresh_again = False
+        self._remote_refresh_seq += 1
         
+        # List in the background, fill the tree back on the Tk thread
+        self._run_remote(self._fetch_remote_files, path, self._remote_refresh_seq)
+    
+    def _fetch_remote_files(self, path, seq):
+        """List a remote folder off the Tk thread"""
+        error = None
         try:
-            # Add remote files and folders
-            items = []
-            for item in sftp_client.listdir_attr(self.remote_current_path):
-                if item.st_mode is not None:
-                    if self.is_directory(item.st_mode):
-                        items.append((item.filename, "Folder", "", True))
-                    else:
-                        size = item.st_size if item.st_size is not None else 0
-                        modified = datetime.fromtimestamp(item.st_mtime) if item.st_mtime else datetime.now()
-                        items.append((item.filename, self.format_size(size), modified.strftime("%Y-%m-%d %H:%M"), False))
-            
-            # Sort (folders first, then files)
-            items.sort(key=lambda x: (not x[3], x[0].lower()))
-            
-            for name, size, modified, is_dir in items:
-                icon = "📁" if is_dir else "📄"
-                item_id = self.remote_tree.insert("", "end", text=f"{icon} {name}", values=(size, modified))
-                if is_dir:
-                    self.remote_tree.set(item_id, "size", "Folder")
-            
+            items = self._list_remote_dir(self._remote_client(), path)
         except Exception as e:
-            messagebox.showerror("Error", f"Error loading remote files: {e}")
+            items = []
+            error = e
         
-        self.remote_path_label.config(text=self.remote_current_path)
+        self.root.after(0, self._show_remote_files, path, seq, items, error)
+    
+    def _list_remote_dir(self, sftp_client, path):
+        """Return the sorted listing rows of a remote folder"""
+        # Add remote files and folders
+        items = []
+        for item in sftp_client.listdir_attr(path):
+            if item.st_mode is not None:
+                name = item.filename
+                if self.is_directory(item.st_mode):
+                    items.append((0, name.lower(), name, "Folder", ""))
+                else:
+                    size = item.st_size if item.st_size is not None else 0
+                    modified = self._format_mtime(item.st_mtime if item.st_mtime else time.time())
+                    items.append((1, name.lower(), name, self.format_size(size), modified))
+        
+        # Sort (folders first, then files)
+        items.sort(key=self._SORT_KEY)
+        return items
+    
+    def _show_remote_files(self, path, seq, items, error):
+        """Fill the remote tree with a finished listing"""
+        # A newer listing is on its way
+        if seq != self._remote_refresh_seq:
+            return
+        self._remote_refresh_inflight = None
+        
+        if error is None:
+            self._cache_listing(path, items)
+        self._populate_tree(self.remote_tree, items)
+        self.remote_path_label.config(text=path)
+        
+        if error is None:
+            self._prefetch_children(path, items)
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Error loading remote files: {error}")
+        
+        # Pick up changes made while the listing was running
+        if self._remote_refresh_again:
+            self.refresh_remote_files()
+    
+    def _get_cached_listing(self, path):
+        """Return a cached remote listing that is still fresh, or None"""
+        entry = self._remote_cache.get(path)
+        if entry is None:
+            return None
+        stamp, items = entry
+        if time.monotonic() - stamp >= self.REMOTE_CACHE_TTL:
+            del self._remote_cache[path]
+            return None
+        self._remote_cache.move_to_end(path)
+        return items
+    
+    def _cache_listing(self, path, items):
+        """Remember a remote listing, evicting the least recently used"""
+        self._remote_cache[path] = (time.monotonic(), items)
+        self._remote_cache.move_to_end(path)
+        while len(self._remote_cache) > self.REMOTE_CACHE_SIZE:
+            self._remote_cache.popitem(last=False)
+    
+    def _prefetch_children(self, path, items):
+        """List the first few uncached child folders in the background"""
+        prefix = path.rstrip("/") + "/"
+        children = [prefix + name for rank, _, name, _, _ in items if rank == 0]
+        for child in [c for c in children if self._get_cached_listing(c) is None][:self.PREFETCH_LIMIT]:
+            self._prefetch_futures.append(
+                self._prefetch_executor.submit(self._prefetch_remote_dir, child, self._cache_generation))
+    
+    def _prefetch_remote_dir(self, path, generation):
+        """List a remote folder for the cache, called on the prefetch thread"""
+        try:
+            sftp_client = self._prefetch_client()
+            if sftp_client is None:
+                return
+            items = self._list_remote_dir(sftp_client, path)
+        except Exception:
+            return
+        self.root.after(0, self._store_prefetched, sftp_client.get_channel().get_transport(), path, items, generation)
+    
+    def _prefetch_client(self):
+        """Return the prefetch thread's SFTP channel, reopened for a new session"""
+        transport = self.connection_manager.get_transport()
+        client = self._prefetch_sftp
+        if client is not None and (client.get_channel().closed or client.get_channel().get_transport() is not transport):
+            client.close()
+            client = None
+        if client is None and transport is not None:
+            client = self.connection_manager.open_sftp_channel(transport)
+        self._prefetch_sftp = client
+        return client
+    
+    def _close_prefetch_client(self):
+        """Close the prefetch channel, called on the prefetch thread"""
+        if self._prefetch_sftp is not None:
+            self._prefetch_sftp.close()
+            self._prefetch_sftp = None
+    
+    def _store_prefetched(self, transport, path, items, generation):
+        """Cache a prefetched listing unless the session or the cache changed meanwhile"""
+        # A delete, rename or upload since the listing started may have changed the folder
+        if generation != self._cache_generation:
+            return
+        if transport is self.connection_manager.get_transport():
+            self._cache_listing(path, items)
+    
+    def _cancel_prefetch(self):
+        """Drop prefetches that have not started yet"""
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures = []
+    
+    def _cached_is_dir(self, path):
+        """Folder check from the parent's cached listing; None when not cached"""
+        cached = self._get_cached_listing(posixpath.dirname(path) or "/")
+        if cached is not None:
+            name = posixpath.basename(path)
+            for rank, _, item_name, _, _ in cached:
+                if item_name == name:
+                    return rank == 0
+        return None
+    
+    def _invalidate_remote_cache(self, path):
+        """Forget cached listings of a remote folder and everything below it"""
+        # Prefetches listed before this change must not refill the cache
+        self._cancel_prefetch()
+        self._cache_generation += 1
+        
+        prefix = path.rstrip("/") + "/"
+        for cached_path in [p for p in self._remote_cache if p == path or p.startswith(prefix)]:
+            del self._remote_cache[cached_path]
+    
+    def _populate_tree(self, tree, items):
+        """Replace all rows of a file tree, large folders in idle batches"""
+        self._cancel_fill(tree)
+        
+        # Build the rows before touching the widget
+        rows = [(("📄 " if rank else "📁 ") + name, (size, modified), name, not rank) for rank, _, name, size, modified in items]
+        
+        # Clear current items
+        self._tree_rows[str(tree)] = {}
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        
+        # Show the first screenful now, the rest while idle
+        self._insert_rows(tree, rows, 0, self.TREE_BATCH_SIZE)
+    
+    def _insert_rows(self, tree, rows, start, end):
+        """Insert rows[start:end] and schedule the rest"""
+        insert = tree.insert
+        entries = self._tree_rows[str(tree)]
+        for text, values, name, is_dir in rows[start:end]:
+            entries[insert("", "end", text=text, values=values)] = (name, is_dir)
+        
+        if end < len(rows):
+            job = self.root.after(1, self._insert_rows, tree, rows, end, end + self.TREE_BATCH_SIZE)
+            self._fill_jobs[str(tree)] = (job, rows, end)
+        else:
+            self._fill_jobs.pop(str(tree), None)
+    
+    def _cancel_fill(self, tree):
+        """Drop rows still waiting to be inserted"""
+        pending = self._fill_jobs.pop(str(tree), None)
+        if pending:
+            self.root.after_cancel(pending[0])
+    
+    def _finish_fill(self, tree):
+        """Insert all rows still waiting right away"""
+        pending = self._fill_jobs.pop(str(tree), None)
+        if pending:
+            job, rows, start = pending
+            self.root.after_cancel(job)
+            self._insert_rows(tree, rows, start, len(rows))
+    
+    def _row_entry(self, tree, item_id):
+        """Return (name, is_dir) of a file tree row"""
+        return self._tree_rows[str(tree)][item_id]
     
     def is_directory(self, mode: int) -> bool:
         """Check if mode represents a directory"""
-        return (mode & 0o040000) != 0
+        return S_ISDIR(mode)
     
     def local_double_click(self, event):
         """Handle local file double click"""
         selection = self.local_tree.selection()
         if selection:
-            item = self.local_tree.item(selection[0])
-            name = item["text"].replace("📁 ", "").replace("📄 ", "")
-            if name.startswith("📁"):
-                name = name[2:]
-            
-            path = os.path.join(self.local_current_path, name)
-            if os.path.isdir(path):
-                self.local_current_path = path
+            name, is_dir = self._row_entry(self.local_tree, selection[0])
+            if is_dir:
+                self.local_current_path = os.path.join(self.local_current_path, name)
                 self.refresh_local_files()
     
     def remote_double_click(self, event):
@@ -578,47 +890,22 @@ class FileTransferGUI:
         
         selection = self.remote_tree.selection()
         if selection:
-            item = self.remote_tree.item(selection[0])
-            name = item["text"].replace("📁 ", "").replace("📄 ", "")
-            if name.startswith("📁"):
-                name = name[2:]
-            
-            remote_path = os.path.join(self.remote_current_path, name).replace("\\", "/")
-            
-            try:
-                # Check if it's a directory
-                sftp_client = self.connection_manager.get_sftp_client()
-                stat = sftp_client.stat(remote_path)
-                if self.is_directory(stat.st_mode):
-                    self.remote_current_path = remote_path
-                    self.refresh_remote_files()
-            except:
-                pass
+            name, is_dir = self._row_entry(self.remote_tree, selection[0])
+            if is_dir:
+                self._enter_remote_folder(posixpath.join(self.remote_current_path, name))
+    
+    def _enter_remote_folder(self, remote_path):
+        """Navigate into a remote folder"""
+        self.remote_current_path = remote_path
+        self.refresh_remote_files(use_cache=True)
     
     def local_right_click(self, event):
         """Handle local file right click"""
         selection = self.local_tree.selection()
         if selection:
-            item = self.local_tree.item(selection[0])
-            name = item["text"].replace("📁 ", "").replace("📄 ", "")
-            if name.startswith("📁"):
-                name = name[2:]
-            
-            local_path = os.path.join(self.local_current_path, name)
-            
-            # Context menu
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="Transfer to Remote", command=self.transfer_to_remote)
-            context_menu.add_separator()
-            context_menu.add_command(label="Rename", command=lambda: self.rename_local_file(local_path))
-            context_menu.add_command(label="Delete", command=lambda: self.delete_local_file(local_path))
-            context_menu.add_separator()
-            context_menu.add_command(label="File Info", command=lambda: messagebox.showinfo("File Info", f"File: {name}\nPath: {local_path}"))
-            
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
+            name, is_dir = self._row_entry(self.local_tree, selection[0])
+            self._local_ctx = (name, os.path.join(self.local_current_path, name), is_dir)
+            self._popup_menu(self.local_context_menu, event)
     
     def remote_right_click(self, event):
         """Handle remote file right click"""
@@ -627,31 +914,26 @@ class FileTransferGUI:
         
         selection = self.remote_tree.selection()
         if selection:
-            item = self.remote_tree.item(selection[0])
-            name = item["text"].replace("📁 ", "").replace("📄 ", "")
-            if name.startswith("📁"):
-                name = name[2:]
-            
-            remote_path = os.path.join(self.remote_current_path, name).replace("\\", "/")
-            
-            # Context menu
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="Download to PC", command=self.transfer_to_local)
-            context_menu.add_separator()
-            context_menu.add_command(label="Rename", command=lambda: self.rename_remote_file(remote_path))
-            context_menu.add_command(label="Delete", command=lambda: self.delete_remote_file(remote_path))
-            context_menu.add_separator()
-            context_menu.add_command(label="File Info", command=lambda: messagebox.showinfo("File Info", f"File: {name}\nPath: {remote_path}"))
-            
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
+            name, is_dir = self._row_entry(self.remote_tree, selection[0])
+            self._remote_ctx = (name, posixpath.join(self.remote_current_path, name), is_dir)
+            self._popup_menu(self.remote_context_menu, event)
+    
+    def _popup_menu(self, menu, event):
+        """Show a context menu at the pointer"""
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+    
+    def _show_file_info(self, name, path):
+        """Show name and path of a context menu target"""
+        messagebox.showinfo("File Info", f"File: {name}\nPath: {path}")
     
     def local_back(self):
         """Navigate back in local directory"""
-        if self.local_current_path != os.path.dirname(self.local_current_path):
-            self.local_current_path = os.path.dirname(self.local_current_path)
+        parent = os.path.dirname(self.local_current_path)
+        if parent != self.local_current_path:
+            self.local_current_path = parent
             self.refresh_local_files()
     
     def local_up(self):
@@ -664,24 +946,26 @@ class FileTransferGUI:
     def remote_back(self):
         """Navigate back in remote directory"""
         if self.remote_current_path != "/" and self.remote_current_path != "":
-            self.remote_current_path = os.path.dirname(self.remote_current_path) or "/"
-            self.refresh_remote_files()
+            self.remote_current_path = posixpath.dirname(self.remote_current_path) or "/"
+            self.refresh_remote_files(use_cache=True)
     
     def remote_up(self):
         """Navigate up in remote directory"""
         if self.remote_current_path != "/":
-            self.remote_current_path = os.path.dirname(self.remote_current_path) or "/"
-            self.refresh_remote_files()
+            self.remote_current_path = posixpath.dirname(self.remote_current_path) or "/"
+            self.refresh_remote_files(use_cache=True)
     
     def select_all_local(self):
         """Select all local files"""
-        for item_id in self.local_tree.get_children():
-            self.local_tree.selection_add(item_id)
+        self._finish_fill(self.local_tree)
+        self.local_tree.selection_set(self.local_tree.get_children())
     
     def select_all_remote(self):
         """Select all remote files"""
-        for item_id in self.remote_tree.get_children():
-            self.remote_tree.selection_add(item_id)
+        if self.remote_tree is None:
+            return
+        self._finish_fill(self.remote_tree)
+        self.remote_tree.selection_set(self.remote_tree.get_children())
     
     def transfer_to_remote(self):
         """Transfer files to remote"""
@@ -697,15 +981,28 @@ class FileTransferGUI:
         # Get selected files
         selected_files = []
         for item_id in selection:
-            item = self.local_tree.item(item_id)
-            name = item["text"].replace("📁 ", "").replace("📄 ", "")
-            if name.startswith("📁"):
-                name = name[2:]
+            name, _ = self._row_entry(self.local_tree, item_id)
             local_path = os.path.join(self.local_current_path, name)
-            selected_files.append((local_path, os.path.join(self.remote_current_path, name).replace("\\", "/")))
+            selected_files.append((local_path, posixpath.join(self.remote_current_path, name)))
         
         if selected_files:
-            self.file_transfer.transfer_files(selected_files, "upload")
+            # Forget the listings once the files are there, not before
+            destinations = [remote_path for _, remote_path in selected_files]
+            self.file_transfer.transfer_files(
+                selected_files, "upload",
+                on_complete=lambda: self.root.after(0, self._upload_finished, destinations))
+    
+    def _upload_finished(self, destinations):
+        """Drop cached listings an upload changed and show the new files"""
+        parents = {posixpath.dirname(path) or "/" for path in destinations}
+        for parent in parents:
+            self._remote_cache.pop(parent, None)
+        # Uploaded folders: their own listings and everything below them
+        for path in destinations:
+            self._invalidate_remote_cache(path)
+        
+        if self.remote_current_path in parents or self.remote_current_path in destinations:
+            self.refresh_remote_files()
     
     def transfer_to_local(self):
         """Transfer files to local"""
@@ -721,11 +1018,8 @@ class FileTransferGUI:
         # Get selected files
         selected_files = []
         for item_id in selection:
-            item = self.remote_tree.item(item_id)
-            name = item["text"].replace("📁 ", "").replace("📄 ", "")
-            if name.startswith("📁"):
-                name = name[2:]
-            remote_path = os.path.join(self.remote_current_path, name).replace("\\", "/")
+            name, _ = self._row_entry(self.remote_tree, item_id)
+            remote_path = posixpath.join(self.remote_current_path, name)
             selected_files.append((remote_path, os.path.join(self.local_current_path, name)))
         
         if selected_files:
@@ -755,50 +1049,44 @@ class FileTransferGUI:
         
         folder_name = simpledialog.askstring("Create Folder", "Folder name:")
         if folder_name:
-            try:
-                sftp_client = self.connection_manager.get_sftp_client()
-                folder_path = os.path.join(self.remote_current_path, folder_name).replace("\\", "/")
-                sftp_client.mkdir(folder_path)
-                self.refresh_remote_files()
-                messagebox.showinfo("Success", f"Folder '{folder_name}' created.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error creating folder: {e}")
+            folder_path = posixpath.join(self.remote_current_path, folder_name)
+            self._run_remote_task(lambda: self._remote_client().mkdir(folder_path),
+                                  f"Folder '{folder_name}' created.", "Error creating folder",
+                                  [self.remote_current_path])
     
     
     def show_transfer_log(self):
         """Show transfer log"""
-        log = self.file_transfer.get_transfer_log()
+        log = self.file_transfer.get_recent_transfers(10)  # Show last 10 entries
         if not log:
             messagebox.showinfo("Transfer Log", "No transfers recorded.")
             return
         
         # Simple log display
-        log_text = "Transfer Log:\n\n"
-        for entry in log[-10:]:  # Show last 10 entries
-            log_text += f"{entry['timestamp']} - {entry['action']}: {entry['filename']}\n"
+        log_text = "Transfer Log:\n\n" + "".join(
+            f"{entry['timestamp']} - {entry['action']}: {entry['filename']}\n" for entry in log)
         
         messagebox.showinfo("Transfer Log", log_text)
     
-    def rename_local_file(self, file_path):
-        """Rename local file/folder"""
+    def rename_local_file(self, file_path, is_dir=None):
+        """Rename local file/folder; is_dir skips the type lookup when known"""
         old_name = os.path.basename(file_path)
         
-        # Preserve file extension
-        if os.path.isfile(file_path):
-            name_part, ext_part = os.path.splitext(old_name)
-            initial_value = name_part
+        # Preserve file extension, looked up once for the dialog and the rename
+        if is_dir is None:
+            is_dir = not os.path.isfile(file_path)
+        if is_dir:
+            initial_value, ext_part = old_name, ""
         else:
-            initial_value = old_name
+            initial_value, ext_part = os.path.splitext(old_name)
         
         new_name = simpledialog.askstring("Rename", f"New name:", initialvalue=initial_value)
         
         if new_name and new_name != initial_value:
             try:
                 # Add extension if it's a file
-                if os.path.isfile(file_path):
-                    name_part, ext_part = os.path.splitext(old_name)
-                    if not new_name.endswith(ext_part):
-                        new_name = new_name + ext_part
+                if not new_name.endswith(ext_part):
+                    new_name = new_name + ext_part
                 
                 new_path = os.path.join(os.path.dirname(file_path), new_name)
                 os.rename(file_path, new_path)
@@ -807,47 +1095,35 @@ class FileTransferGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Rename error: {e}")
     
-    def rename_remote_file(self, file_path):
-        """Rename remote file/folder"""
+    def rename_remote_file(self, file_path, is_dir=None):
+        """Rename remote file/folder; is_dir skips the type lookup when known"""
         if not self.connection_manager.is_connected_to_server():
             messagebox.showerror("Error", "No connection!")
             return
         
         old_name = os.path.basename(file_path)
         
-        # Preserve file extension
-        try:
-            sftp_client = self.connection_manager.get_sftp_client()
-            stat = sftp_client.stat(file_path)
-            if not self.is_directory(stat.st_mode):  # If it's a file
-                name_part, ext_part = os.path.splitext(old_name)
-                initial_value = name_part
-            else:  # If it's a folder
-                initial_value = old_name
-        except:
-            initial_value = old_name
+        # Preserve file extension; the type comes from the listing, no network call here
+        if is_dir is None:
+            is_dir = self._cached_is_dir(file_path)
+        if is_dir is None:
+            is_dir = True  # Unknown type: keep the name as it is
+        if is_dir:
+            initial_value, ext_part = old_name, ""
+        else:
+            initial_value, ext_part = os.path.splitext(old_name)
         
         new_name = simpledialog.askstring("Rename", f"New name:", initialvalue=initial_value)
         
         if new_name and new_name != initial_value:
-            try:
-                # Add extension if it's a file
-                try:
-                    sftp_client = self.connection_manager.get_sftp_client()
-                    stat = sftp_client.stat(file_path)
-                    if not self.is_directory(stat.st_mode):  # If it's a file
-                        name_part, ext_part = os.path.splitext(old_name)
-                        if not new_name.endswith(ext_part):
-                            new_name = new_name + ext_part
-                except:
-                    pass
-                
-                new_path = os.path.join(os.path.dirname(file_path), new_name).replace("\\", "/")
-                sftp_client.rename(file_path, new_path)
-                self.refresh_remote_files()
-                messagebox.showinfo("Success", f"'{old_name}' renamed to '{new_name}'.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Rename error: {e}")
+            # Add extension if it's a file
+            if not new_name.endswith(ext_part):
+                new_name = new_name + ext_part
+            
+            new_path = posixpath.join(posixpath.dirname(file_path), new_name)
+            self._run_remote_task(lambda: self._remote_client().rename(file_path, new_path),
+                                  f"'{old_name}' renamed to '{new_name}'.", "Rename error",
+                                  [file_path, self.remote_current_path])
     
     def delete_local_file(self, file_path):
         """Delete local file/folder"""
@@ -859,15 +1135,14 @@ class FileTransferGUI:
                 if os.path.isfile(file_path):
                     os.remove(file_path)
                 elif os.path.isdir(file_path):
-                    import shutil
                     shutil.rmtree(file_path)
                 self.refresh_local_files()
                 messagebox.showinfo("Success", f"'{name}' deleted.")
             except Exception as e:
                 messagebox.showerror("Error", f"Delete error: {e}")
     
-    def delete_remote_file(self, file_path):
-        """Delete remote file/folder"""
+    def delete_remote_file(self, file_path, is_dir=None):
+        """Delete remote file/folder; is_dir skips the type lookup when known"""
         if not self.connection_manager.is_connected_to_server():
             messagebox.showerror("Error", "No connection!")
             return
@@ -876,30 +1151,125 @@ class FileTransferGUI:
         confirm_msg = f"Delete '{name}'?\nThis action cannot be undone!"
         
         if messagebox.askyesno("Confirm Delete", confirm_msg):
-            try:
-                sftp_client = self.connection_manager.get_sftp_client()
-                stat = sftp_client.stat(file_path)
-                if self.is_directory(stat.st_mode):
+            # The listing cache belongs to the Tk thread, consult it here
+            folder = is_dir if is_dir is not None else self._cached_is_dir(file_path)
+            
+            def delete():
+                sftp_client = self._remote_client()
+                if folder is None:
+                    delete_dir = self.is_directory(sftp_client.stat(file_path).st_mode)
+                else:
+                    delete_dir = folder
+                if delete_dir:
                     # Delete directory recursively
                     self._delete_remote_directory(sftp_client, file_path)
                 else:
                     sftp_client.remove(file_path)
-                self.refresh_remote_files()
-                messagebox.showinfo("Success", f"'{name}' deleted.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Delete error: {e}")
+            
+            self._run_remote_task(delete, f"'{name}' deleted.", "Delete error",
+                                  [file_path, self.remote_current_path])
     
     def _delete_remote_directory(self, sftp_client, dir_path):
         """Recursively delete remote directory"""
-        for item in sftp_client.listdir(dir_path):
-            item_path = os.path.join(dir_path, item).replace("\\", "/")
-            stat = sftp_client.stat(item_path)
-            if self.is_directory(stat.st_mode):
-                self._delete_remote_directory(sftp_client, item_path)
-            else:
-                sftp_client.remove(item_path)
-        sftp_client.rmdir(dir_path)
+        # Walk the tree first; listing attributes come with the names, no stat per entry
+        files, folders = [], []
+        pending = [dir_path]
+        while pending:
+            path = pending.pop()
+            folders.append(path)
+            for item in sftp_client.listdir_attr(path):
+                item_path = posixpath.join(path, item.filename)
+                if item.st_mode is not None and self.is_directory(item.st_mode):
+                    pending.append(item_path)
+                else:
+                    files.append(item_path)
+        
+        self._remove_remote_files(sftp_client, files)
+        
+        # Every folder was walked before its subfolders, so remove them in reverse
+        for path in reversed(folders):
+            sftp_client.rmdir(path)
+    
+    def _remove_remote_files(self, sftp_client, paths):
+        """Remove remote files over several SFTP channels so the round trips overlap"""
+        # Workers get channels of their own; the given client stays with this thread
+        channels = []
+        try:
+            while len(channels) < min(self.DELETE_CHANNELS, len(paths)):
+                channel = self.connection_manager.open_sftp_channel()
+                if channel is None:
+                    break
+                channels.append(channel)
+        except Exception:
+            pass  # Use the channels we have
+        
+        def remove_all(channel, part):
+            for path in part:
+                channel.remove(path)
+        
+        try:
+            if len(channels) <= 1:
+                remove_all(sftp_client, paths)
+                return
+            
+            # One SFTP client per thread, each with its own share of the files
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                futures = [executor.submit(remove_all, channel, paths[i::len(channels)])
+                           for i, channel in enumerate(channels)]
+                for future in futures:
+                    future.result()
+        finally:
+            for channel in channels:
+                channel.close()
+    
+    def _run_remote_task(self, work, success_message, error_prefix, changed_paths):
+        """Run a remote file operation off the Tk thread, then refresh and report"""
+        def task():
+            try:
+                work()
+                error = None
+            except Exception as e:
+                error = e
+            self.root.after(0, self._finish_remote_task, success_message, error_prefix, changed_paths, error)
+        
+        # Same queue as listings, so they never share the channel at once
+        self._run_remote(task)
+    
+    def _finish_remote_task(self, success_message, error_prefix, changed_paths, error):
+        """Show the result of a remote file operation"""
+        # Even a failed operation may have changed part of the tree
+        for path in changed_paths:
+            self._invalidate_remote_cache(path)
+        self.refresh_remote_files()
+        
+        if error is None:
+            messagebox.showinfo("Success", success_message)
+        else:
+            messagebox.showerror("Error", f"{error_prefix}: {error}")
+    
+    def _run_in_background(self, func, *args):
+        """Run a blocking call on the shared I/O pool; results go back via root.after"""
+        return self._io_executor.submit(func, *args)
+    
+    def _remote_client(self):
+        """Return the GUI's SFTP channel, called on the SFTP worker"""
+        sftp_client = self.connection_manager.get_sftp_client(interactive=True)
+        if sftp_client is None:
+            raise ConnectionError("No SFTP channel available")
+        return sftp_client
+    
+    def _run_remote(self, func, *args):
+        """Run a call on the GUI's SFTP channel, after any earlier remote call finishes"""
+        return self._sftp_executor.submit(func, *args)
     
     def run(self):
         """Start GUI main loop"""
         self.root.mainloop()
+    
+    def shutdown(self):
+        """Stop accepting background work"""
+        self._cancel_prefetch()
+        self._prefetch_executor.submit(self._close_prefetch_client)
+        self._prefetch_executor.shutdown(wait=False)
+        self._sftp_executor.shutdown(wait=False)
+        self._io_executor.shutdown(wait=False)
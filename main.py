@@ -20,7 +20,10 @@ Author / Yazar: ensfur
 License / Lisans: MIT
 """
 
+import logging
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import messagebox
 
 # Import our custom modules / Özel modüllerimizi içe aktar
@@ -29,10 +32,15 @@ from connection_manager import ConnectionManager
 from file_transfer import FileTransfer
 from gui_components import FileTransferGUI
 
+logger = logging.getLogger(__name__)
+
 
 class FileTransferApp:
     """Main application class / Ana uygulama sınıfı"""
     
+    # Milliseconds between applying queued transfer updates (~60 Hz) / Kuyruktaki transfer güncellemelerinin uygulanması arası milisaniye (~60 Hz)
+    UI_UPDATE_INTERVAL_MS = 16
+    
     def __init__(self, root):
         """
         Initialize the application / Uygulamayı başlat
@@ -48,7 +56,13 @@ class FileTransferApp:
         # Initialize managers / Yöneticileri başlat
         self.config_manager = ConfigManager()
         self.connection_manager = ConnectionManager()
+        
+        # Transfer updates from worker threads, drained on the Tk thread / İşçi thread'lerinden gelen, Tk thread'inde boşaltılan transfer güncellemeleri
+        self._ui_updates = deque()
+        self._ui_lock = threading.Lock()
+        self._drain_scheduled = False
         self.file_transfer = FileTransfer(self.connection_manager)
+        self._apply_transfer_settings()
         
         # Initialize GUI / GUI'yi başlat
         self.gui = FileTransferGUI(
@@ -66,20 +80,77 @@ class FileTransferApp:
     
     def _setup_callbacks(self):
         """Setup application callbacks / Uygulama geri çağırma fonksiyonlarını ayarla"""
-        # Connection callbacks / Bağlantı geri çağırma fonksiyonları
+        # Connection callbacks, run on the Tk thread / Bağlantı geri çağırma fonksiyonları, Tk thread'inde çalışır
         self.connection_manager.set_connection_callbacks(
-            on_connect=self.gui.on_connection_success,
-            on_disconnect=self.gui.on_connection_disconnect,
-            on_error=self.gui.on_connection_error
+            on_connect=lambda: self.root.after(0, self.gui.on_connection_success),
+            on_disconnect=lambda: self.root.after(0, self.gui.on_connection_disconnect),
+            on_error=lambda error_msg: self.root.after(0, self.gui.on_connection_error, error_msg)
         )
         
-        # Transfer callbacks / Transfer geri çağırma fonksiyonları
+        # Transfer callbacks only queue the value / Transfer geri çağırmaları yalnızca değeri kuyruğa alır
         self.file_transfer.set_progress_callbacks(
-            progress_cb=self.gui.update_progress,
-            status_cb=self.gui.update_status,
-            speed_cb=self.gui.update_speed,
-            eta_cb=self.gui.update_eta
+            progress_cb=lambda progress: self._queue_ui_update(self.gui.update_progress, progress),
+            status_cb=lambda status: self._queue_ui_update(self.gui.update_status, status),
+            speed_cb=lambda speed: self._queue_ui_update(self.gui.update_speed, speed),
+            eta_cb=lambda eta: self._queue_ui_update(self.gui.update_eta, eta)
+        )
+    
+    def _queue_ui_update(self, update, value):
+        """
+        Queue a transfer update from any thread / Herhangi bir thread'den transfer güncellemesi kuyruğa al
+        
+        A drain is scheduled only when the queue was empty, so the Tk loop
+        stays idle between transfers.
+        Boşaltma yalnızca kuyruk boşken planlanır; böylece Tk döngüsü
+        transferler arasında boşta kalır.
+        
+        Args:
+            update: GUI method to call / Çağrılacak GUI metodu
+            value: Value to pass / Geçirilecek değer
+        """
+        with self._ui_lock:
+            self._ui_updates.append((update, value))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.root.after(self.UI_UPDATE_INTERVAL_MS, self._drain_ui_updates)
+    
+    def _drain_ui_updates(self):
+        """Apply queued transfer updates on the Tk thread / Kuyruktaki transfer güncellemelerini Tk thread'inde uygula"""
+        with self._ui_lock:
+            pending = list(self._ui_updates)
+            self._ui_updates.clear()
+            self._drain_scheduled = False
+        
+        # Only the newest value per widget is shown / Her widget için yalnızca en yeni değer gösterilir
+        latest = {}
+        for update, value in pending:
+            latest[update] = value
+        
+        for update, value in latest.items():
+            update(value)
+    
+    def _apply_transfer_settings(self):
+        """Apply transfer tuning from settings / Ayarlardaki transfer ayarlarını uygula"""
+        settings = (
+            ("transfer_buffer_size", lambda value: self.file_transfer.set_transfer_options(buffer_size=value)),
+            ("max_concurrent_requests", lambda value: self.file_transfer.set_transfer_options(max_concurrent_requests=value)),
+            ("max_parallel_transfers", lambda value: self.file_transfer.set_transfer_options(max_parallel_transfers=value)),
+            # Smaller buffers suit low-memory Pi clients / Düşük bellekli Pi istemcileri için daha küçük tamponlar
+            ("tcp_buffer_size", lambda value: self.connection_manager.configure_tcp_buffers(value, value)),
+            # More than one spreads transfers over extra SSH connections / Birden fazlası transferleri ek SSH bağlantılarına dağıtır
+            ("parallel_connections", self.connection_manager.set_parallel_connections),
         )
+        
+        # One bad value must not skip the settings after it / Tek bir hatalı değer sonraki ayarları atlatmamalı
+        for key, apply in settings:
+            value = self.config_manager.get_setting(key)
+            if value is None:
+                continue
+            try:
+                apply(value)
+            except (TypeError, ValueError) as e:
+                logger.warning("Invalid setting / Geçersiz ayar %s=%r: %s", key, value, e)
     
     def _load_last_connection(self):
         """Load last used connection / Son kullanılan bağlantıyı yükle"""
@@ -89,10 +160,7 @@ class FileTransferApp:
             connection_info = self.config_manager.get_connection(last_connection)
             if connection_info:
                 self.gui.connection_combo.set(last_connection)
-                self.gui.ip_entry.insert(0, connection_info["ip"])
-                self.gui.user_entry.insert(0, connection_info["user"])
-                self.gui.port_entry.delete(0, tk.END)
-                self.gui.port_entry.insert(0, str(connection_info["port"]))
+                self.gui.fill_connection_fields(connection_info["ip"], connection_info["user"], connection_info["port"])
     
     def run(self):
         """Start the application / Uygulamayı başlat"""
@@ -110,8 +178,11 @@ class FileTransferApp:
             if self.connection_manager.is_connected_to_server():
                 self.connection_manager.disconnect()
             
-            # Save configuration / Konfigürasyonu kaydet
-            self.config_manager.save_config()
+            # Stop background GUI work / Arka plan GUI işlerini durdur
+            self.gui.shutdown()
+            
+            # Save pending configuration changes / Bekleyen konfigürasyon değişikliklerini kaydet
+            self.config_manager.flush()
             
         except Exception as e:
             print(f"Cleanup error / Temizleme hatası: {e}")
@@ -0,0 +1,255 @@
+"""
+Tar streaming, its SFTP fallback and partial resend / Tar akışı, SFTP'ye geri dönüşü ve kısmi yeniden gönderim
+
+The fake SSH client runs remote commands with the local shell and the fake
+SFTP client works on local paths, so "remote" is just another temp folder.
+Sahte SSH istemci uzak komutları yerel kabukla çalıştırır, sahte SFTP
+istemci yerel yollarda çalışır; "uzak" sadece başka bir geçici klasördür.
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import paramiko
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_transfer import FileTransfer  # noqa: E402
+
+
+class FakeRemoteFile(io.FileIO):
+    """Local file with the SFTPFile calls the transfer code makes"""
+
+    MAX_REQUEST_SIZE = 32768
+
+    def set_pipelined(self, pipelined=True):
+        pass
+
+    def prefetch(self, file_size=None, max_concurrent_requests=None):
+        pass
+
+
+class FakeSFTPClient:
+    """SFTP client over local paths that counts the files it opens"""
+
+    def __init__(self):
+        self.opened = []
+
+    def open(self, path, mode='r'):
+        self.opened.append((path, mode))
+        return FakeRemoteFile(path, mode.replace('b', ''))
+
+    def stat(self, path):
+        return paramiko.SFTPAttributes.from_stat(os.stat(path))
+
+    def listdir_attr(self, path):
+        return [paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(path, name)), name)
+                for name in os.listdir(path)]
+
+    def mkdir(self, path):
+        os.mkdir(path)
+
+    def remove(self, path):
+        os.remove(path)
+
+    def posix_rename(self, old_path, new_path):
+        os.replace(old_path, new_path)
+
+    def close(self):
+        pass
+
+
+class FakeChannel:
+    def __init__(self, process):
+        self.process = process
+
+    def recv_exit_status(self):
+        return self.process.wait()
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        for pipe in (self.process.stdin, self.process.stdout, self.process.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+class FakeStream:
+    """Pipe end with the .channel attribute paramiko's ChannelFile has"""
+
+    def __init__(self, pipe, channel):
+        self._pipe = pipe
+        self.channel = channel
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+
+class FakeSSHClient:
+    """
+    Runs exec_command locally / exec_command'ı yerelde çalıştırır
+
+    Args:
+        wrap: Rewrites each command, e.g. to break the stream / Her komutu yeniden yazar, örneğin akışı bozmak için
+    """
+
+    def __init__(self, wrap=None):
+        self.wrap = wrap or (lambda command: command)
+        self.commands = []
+
+    def exec_command(self, command):
+        self.commands.append(command)
+        process = subprocess.Popen(self.wrap(command), shell=True, stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        channel = FakeChannel(process)
+        return (FakeStream(process.stdin, channel), FakeStream(process.stdout, channel),
+                FakeStream(process.stderr, channel))
+
+
+class FakeConnectionManager:
+    def __init__(self, ssh_client):
+        self.ssh_client = ssh_client
+        self.sftp_client = FakeSFTPClient()
+
+    def is_connected_to_server(self):
+        return True
+
+    def get_ssh_client(self):
+        return self.ssh_client
+
+    def get_sftp_client(self):
+        return self.sftp_client
+
+    def get_parallel_transports(self):
+        return []
+
+    def open_sftp_channel(self, transport=None):
+        return None
+
+
+@unittest.skipUnless(shutil.which("tar"), "needs tar")
+class TarTransferTest(unittest.TestCase):
+    FILE_COUNT = 40
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.local = os.path.join(self.root, "local")
+        self.remote = os.path.join(self.root, "remote")
+        os.makedirs(os.path.join(self.local, "sub"))
+        os.makedirs(self.remote)
+
+        # Big enough that the pipe can't hold the whole archive / Borunun tüm arşivi tutamayacağı kadar büyük
+        self.files = {}
+        for i in range(self.FILE_COUNT):
+            name = ("f%02d.bin" if i % 2 else "sub/g%02d.bin") % i
+            data = os.urandom(4096 + i)
+            self.files[name] = data
+            with open(os.path.join(self.local, name), "wb") as f:
+                f.write(data)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def run_transfer(self, ssh_client, file_list, direction):
+        manager = FakeConnectionManager(ssh_client)
+        transfer = FileTransfer(manager)
+        statuses = []
+        transfer.set_progress_callbacks(status_cb=statuses.append)
+        self.assertTrue(transfer.transfer_files(file_list, direction))
+        transfer.current_transfer_thread.join(30)
+        self.assertFalse(transfer.is_transfer_in_progress())
+        return manager.sftp_client, statuses
+
+    def assert_tree(self, folder):
+        for name, data in self.files.items():
+            with open(os.path.join(folder, name), "rb") as f:
+                self.assertEqual(f.read(), data, name)
+
+    def sftp_writes(self, sftp_client, mode):
+        return [path for path, opened_mode in sftp_client.opened if opened_mode == mode]
+
+    def test_upload_over_tar(self):
+        sftp_client, statuses = self.run_transfer(FakeSSHClient(), [(self.local, self.remote)], "upload")
+        self.assert_tree(self.remote)
+        self.assertEqual(self.sftp_writes(sftp_client, "wb"), [])
+        self.assertEqual(statuses[-1], "Transfer completed")
+
+    def test_upload_gives_files_sftp_mtimes(self):
+        old = time.time() - 86400
+        os.utime(os.path.join(self.local, "f01.bin"), (old, old))
+        start = int(time.time())
+        self.run_transfer(FakeSSHClient(), [(self.local, self.remote)], "upload")
+        self.assertGreaterEqual(os.stat(os.path.join(self.remote, "f01.bin")).st_mtime, start)
+
+    def test_upload_falls_back_without_tar(self):
+        ssh_client = FakeSSHClient(lambda command: "date +%s; cat > /dev/null; exit 127")
+        sftp_client, statuses = self.run_transfer(ssh_client, [(self.local, self.remote)], "upload")
+        self.assert_tree(self.remote)
+        self.assertEqual(len(self.sftp_writes(sftp_client, "wb")), self.FILE_COUNT)
+        self.assertEqual(statuses[-1], "Transfer completed")
+
+    def test_partial_upload_resends_only_missing_files(self):
+        # Stale copies of the same size must not count as delivered / Aynı boyuttaki eski kopyalar teslim edilmiş sayılmamalı
+        old = time.time() - 86400
+        for name, data in self.files.items():
+            path = os.path.join(self.remote, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(b"\0" * len(data))
+            os.utime(path, (old, old))
+
+        # The remote side only reads part of the archive / Uzak taraf arşivin yalnızca bir kısmını okur
+        limit = 20 * 5120
+        ssh_client = FakeSSHClient(lambda command: command.replace("tar xmof -", f"head -c {limit} | tar xmof -"))
+        sftp_client, statuses = self.run_transfer(ssh_client, [(self.local, self.remote)], "upload")
+
+        self.assert_tree(self.remote)
+        resent = self.sftp_writes(sftp_client, "wb")
+        self.assertGreater(len(resent), 0)
+        self.assertLess(len(resent), self.FILE_COUNT)
+        self.assertEqual(len(resent), len(set(resent)))
+        self.assertEqual(statuses[-1], "Transfer completed")
+
+    def test_download_over_tar(self):
+        shutil.copytree(self.local, self.remote, dirs_exist_ok=True)
+        target = os.path.join(self.root, "download")
+        sftp_client, statuses = self.run_transfer(FakeSSHClient(), [(self.remote, target)], "download")
+        self.assert_tree(target)
+        self.assertEqual(self.sftp_writes(sftp_client, "rb"), [])
+        self.assertEqual(statuses[-1], "Transfer completed")
+
+    def test_download_falls_back_without_tar(self):
+        shutil.copytree(self.local, self.remote, dirs_exist_ok=True)
+        target = os.path.join(self.root, "download")
+        ssh_client = FakeSSHClient(lambda command: "cat > /dev/null; exit 127")
+        sftp_client, statuses = self.run_transfer(ssh_client, [(self.remote, target)], "download")
+        self.assert_tree(target)
+        self.assertEqual(len(self.sftp_writes(sftp_client, "rb")), self.FILE_COUNT)
+
+    def test_partial_download_resends_only_missing_files(self):
+        shutil.copytree(self.local, self.remote, dirs_exist_ok=True)
+        target = os.path.join(self.root, "download")
+        limit = 20 * 5120
+        ssh_client = FakeSSHClient(lambda command: f"{command} | head -c {limit}")
+        sftp_client, statuses = self.run_transfer(ssh_client, [(self.remote, target)], "download")
+
+        self.assert_tree(target)
+        resent = self.sftp_writes(sftp_client, "rb")
+        self.assertGreater(len(resent), 0)
+        self.assertLess(len(resent), self.FILE_COUNT)
+        self.assertEqual(len(resent), len(set(resent)))
+        leftovers = [name for _, _, names in os.walk(target) for name in names if name.endswith(".part")]
+        self.assertEqual(leftovers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()